@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Measure in-process requests/sec through the full middleware stack.
+
+Requests go straight to the ASGI app over httpx's transport, so the numbers
+reflect framework and middleware overhead rather than the network. The
+/boards/all run needs a migrated database at DATABASE_URL.
+
+Usage:
+    python scripts/benchmark_requests.py [requests] [concurrency]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Every request comes from the same client, keep the limiter counting but never refusing
+os.environ.setdefault("RATE_LIMIT", "1000000000/minute")
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.app.main import app  # noqa: E402
+from src.app.storage_setup import engine  # noqa: E402
+
+PATHS = ["/health", "/boards/all?limit=20"]
+
+
+async def measure(client: AsyncClient, path: str, requests: int, concurrency: int) -> float:
+    async def worker(count: int):
+        for _ in range(count):
+            response = await client.get(path)
+            response.raise_for_status()
+
+    # Warm up connections and caches before timing
+    await worker(50)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+
+    return requests // concurrency * concurrency / (time.perf_counter() - started)
+
+
+async def benchmark(requests: int, concurrency: int) -> dict:
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://localhost") as client:
+            return {path: await measure(client, path, requests, concurrency) for path in PATHS}
+    finally:
+        await engine.dispose()
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    for path, rate in asyncio.run(benchmark(requests, concurrency)).items():
+        print(f"{path:<25} {rate:>8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Compare uuid4 and uuid7 primary keys on a vote-shaped table.
+
+Inserts the same number of rows keyed by each generator into scratch tables
+and reports insert throughput, primary key index size and WAL written.
+Tables live in the uuid_benchmark schema, which is dropped afterwards.
+
+Usage:
+    python scripts/benchmark_uuid_keys.py [rows] [batch_size]
+"""
+
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import text  # noqa: E402
+
+from src.app.storage_setup import engine  # noqa: E402
+from src.domain.models.ids import uuid7  # noqa: E402
+
+SCHEMA = "uuid_benchmark"
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+async def run(name: str, generate, rows: int, batch_size: int) -> dict:
+    table = f"{SCHEMA}.vote_{name}"
+    insert = text(
+        f"INSERT INTO {table} (id, idea_id, user_id, board_id)"
+        " VALUES (:id, :idea_id, :user_id, :board_id)"
+    )
+
+    # A handful of boards and ideas, like a real voting event
+    boards = [uuid.uuid4() for _ in range(10)]
+    ideas = [uuid.uuid4() for _ in range(100)]
+
+    async with engine.begin() as connection:
+        await connection.execute(
+            text(
+                f"CREATE TABLE {table} (id uuid PRIMARY KEY, idea_id uuid NOT NULL,"
+                " user_id uuid NOT NULL, board_id uuid NOT NULL)"
+            )
+        )
+        wal_before = (await connection.execute(text("SELECT pg_current_wal_lsn()"))).scalar()
+
+    started = time.perf_counter()
+
+    for offset in range(0, rows, batch_size):
+        batch = [
+            {
+                "id": generate(),
+                "idea_id": ideas[n % len(ideas)],
+                "user_id": uuid.uuid4(),
+                "board_id": boards[n % len(boards)],
+            }
+            for n in range(offset, min(offset + batch_size, rows))
+        ]
+
+        async with engine.begin() as connection:
+            await connection.execute(insert, batch)
+
+    elapsed = time.perf_counter() - started
+
+    async with engine.begin() as connection:
+        wal = await connection.execute(
+            text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), :before)"),
+            {"before": wal_before},
+        )
+        index_size = await connection.execute(
+            text("SELECT pg_relation_size(:index)"), {"index": f"{table}_pkey"}
+        )
+
+        return {
+            "generator": name,
+            "rows_per_sec": rows / elapsed,
+            "index_mb": index_size.scalar() / 2**20,
+            "wal_mb": float(wal.scalar()) / 2**20,
+        }
+
+
+async def benchmark(rows: int, batch_size: int) -> list[dict]:
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+        return [
+            await run(name, generate, rows, batch_size) for name, generate in GENERATORS.items()
+        ]
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    print(f"{'generator':<10} {'rows/s':>10} {'pkey MB':>10} {'WAL MB':>10}")
+    for result in asyncio.run(benchmark(rows, batch_size)):
+        print(
+            f"{result['generator']:<10} {result['rows_per_sec']:>10.0f}"
+            f" {result['index_mb']:>10.1f} {result['wal_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Rebuild idea.votes_count from the raw vote table.
+
+Counters are maintained in the same statement as every vote insert/delete,
+so this is only needed after manual data fixes or to verify consistency.
+Without a board id every board is repaired, one transaction each, so votes
+only ever wait on the board being recounted.
+
+Usage:
+    python scripts/reconcile_vote_counters.py [board_id]
+"""
+
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.app.di_frame import create_uow  # noqa: E402
+from src.app.storage_setup import engine  # noqa: E402
+from src.domain.models.board import Board  # noqa: E402
+from src.domain.models.idea import Idea  # noqa: E402
+
+BOARDS_PAGE_SIZE = 500
+
+
+async def reconcile_board(board_id: uuid.UUID) -> list:
+    async with create_uow() as uow:
+        return await uow.repositories[Idea].reconcile_vote_counters(board_id)
+
+
+async def reconcile(board_id: Optional[uuid.UUID]) -> list:
+    try:
+        if board_id is not None:
+            return await reconcile_board(board_id)
+
+        repaired, after = [], None
+        while True:
+            async with create_uow(read_only=True) as uow:
+                boards = await uow.repositories[Board].get_all(BOARDS_PAGE_SIZE, after)
+
+            for board in boards:
+                repaired += await reconcile_board(board.id)
+
+            if len(boards) < BOARDS_PAGE_SIZE:
+                return repaired
+            after = boards[-1].id
+    finally:
+        await engine.dispose()
+
+
+def main():
+    board_id = None
+    if len(sys.argv) > 1:
+        try:
+            board_id = uuid.UUID(sys.argv[1])
+        except ValueError:
+            print(f"Invalid board id: {sys.argv[1]}", file=sys.stderr)
+            sys.exit(2)
+
+    repaired = asyncio.run(reconcile(board_id))
+
+    print(f"Repaired counters: {len(repaired)}")
+    for idea_id in repaired:
+        print(f"  idea {idea_id}")
+
+
+if __name__ == "__main__":
+    main()
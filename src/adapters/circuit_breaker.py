@@ -0,0 +1,136 @@
+import math
+import random
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Optional
+from weakref import WeakKeyDictionary
+
+from src.adapters.logger import logger
+from src.config import settings
+from src.exceptions.base import DatabaseUnavailable
+
+
+class CircuitState(Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitBreaker:
+    # Tracks the outcome of the last `window` units of work against one database.
+    # Too many connection failures open it and units fail fast without touching
+    # the network; after `reset_timeout` a few probe units are let through and
+    # their outcome decides whether it closes again
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        reset_timeout: float = 10.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+
+        self.state = CircuitState.closed
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes = 0
+
+        self.opened = 0
+        self.rejected = 0
+
+    def acquire(self) -> bool:
+        # Returns whether the caller is a half-open probe, raises while open
+        if self.state == CircuitState.open:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                self._reject()
+
+            self.state = CircuitState.half_open
+            self._probes = 0
+
+        if self.state == CircuitState.half_open:
+            if self._probes >= self.half_open_probes:
+                self._reject()
+
+            self._probes += 1
+            return True
+
+        return False
+
+    def release(self, probe: bool, failed: Optional[bool]):
+        # failed is None when the unit ended without telling anything about the database
+        if probe:
+            self._probes -= 1
+
+            if failed:
+                self._open()
+            elif failed is False:
+                self._close()
+            return
+
+        if failed is None or self.state != CircuitState.closed:
+            return
+
+        self._outcomes.append(failed)
+        if len(self._outcomes) >= self.min_calls and self._rate() >= self.failure_rate:
+            self._open()
+
+    def retry_after(self) -> int:
+        # Jittered so clients turned away together don't all come back together
+        remaining = max(self.reset_timeout - (self._clock() - self._opened_at), 0)
+        return max(math.ceil(remaining + random.uniform(0, self.reset_timeout / 2)), 1)
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "calls": len(self._outcomes),
+            "failure_rate": self._rate(),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+    def _rate(self) -> float:
+        return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def _reject(self):
+        self.rejected += 1
+        raise DatabaseUnavailable(self.retry_after())
+
+    def _open(self):
+        # Logged once per transition rather than per request turned away
+        if self.state != CircuitState.open:
+            logger.error("Database circuit breaker opened")
+        self.state = CircuitState.open
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self.opened += 1
+
+    def _close(self):
+        if self.state != CircuitState.closed:
+            logger.warning("Database circuit breaker closed")
+        self.state = CircuitState.closed
+        self._outcomes.clear()
+
+
+_breakers: "WeakKeyDictionary[object, CircuitBreaker]" = WeakKeyDictionary()
+
+
+def breaker_for(session_factory) -> CircuitBreaker:
+    # One breaker per database, the primary and every replica trip independently
+    breaker = _breakers.get(session_factory)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            window=settings.db_breaker_window,
+            min_calls=settings.db_breaker_min_calls,
+            failure_rate=settings.db_breaker_failure_rate,
+            reset_timeout=settings.db_breaker_reset_timeout,
+            half_open_probes=settings.db_breaker_half_open_probes,
+        )
+        _breakers[session_factory] = breaker
+    return breaker
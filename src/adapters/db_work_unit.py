@@ -1,42 +1,192 @@
+import asyncio
 from typing import Any, Callable, Type
 
+from sqlalchemy.exc import DBAPIError
+
+from src.adapters import deadline
+from src.adapters.circuit_breaker import breaker_for
+from src.exceptions.base import DatabaseUnavailable, DeadlineExceeded
+
+QUERY_CANCELED = "57014"
+# admin_shutdown, crash_shutdown, cannot_connect_now, plus the whole 08 connection class
+SERVER_UNAVAILABLE = {"57P01", "57P02", "57P03"}
+
+
+def _is_statement_timeout(exc: BaseException) -> bool:
+    return isinstance(exc, DBAPIError) and getattr(exc.orig, "sqlstate", None) == QUERY_CANCELED
+
+
+def _is_connection_failure(exc: BaseException) -> bool:
+    # Only failures that say the database itself is unreachable count against the
+    # breaker; constraint errors, statement timeouts and overload shedding don't
+    # asyncio.TimeoutError (a connect timeout) is only an OSError from 3.11 on
+    if isinstance(exc, (OSError, asyncio.TimeoutError)):
+        return True
+    if not isinstance(exc, DBAPIError):
+        return False
+    if exc.connection_invalidated:
+        return True
+
+    sqlstate = getattr(exc.orig, "sqlstate", None) or ""
+    return sqlstate.startswith("08") or sqlstate in SERVER_UNAVAILABLE
+
+
+class LazyRepositories(dict):
+    # Builds a repository on first lookup, so untouched ones cost nothing
+    def __init__(self, uow: "DBWorkUnit"):
+        super().__init__()
+        self._uow = uow
+
+    def __missing__(self, value_type: Type) -> Any:
+        repository = self._uow._repos[value_type](self._uow.session)
+        self[value_type] = repository
+        return repository
+
 
 class DBWorkUnit:
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, read_only: bool = False, replica_session_factory=None):
         self.session_factory = session_factory
-        self.session = None
+        self.read_only = read_only
+        self.replica_session_factory = replica_session_factory
+        # Set for clients that just wrote: their reads skip per-worker caches too,
+        # which another worker's write may have left stale
+        self.pinned_to_primary = False
+        self._session = None
+        self._breaker = None
+        self._probe = False
+        self._connection_failed = False
 
-        self.repositories: dict[Type, Any] = {}
+        self.repositories: dict[Type, Any] = LazyRepositories(self)
         self._repos: dict[Type, Callable] = {}
 
+        self._commit_hooks: list[Callable[[], None]] = []
+
+        # Nested `async with uow` blocks share the outermost session and transaction
+        self._depth = 0
+        self._failed = False
+
+    @property
+    def session(self):
+        # Opened on first use, so requests that never query don't take a pooled connection
+        if self._session is None:
+            session_factory = self._pick_session_factory()
+
+            # Fails fast with a 503 while the database's breaker is open
+            breaker = breaker_for(session_factory)
+            self._probe = breaker.acquire()
+            self._breaker = breaker
+
+            self._session = session_factory()
+        return self._session
+
+    def _pick_session_factory(self):
+        if self.read_only and self.replica_session_factory is not None:
+            return self.replica_session_factory
+        return self.session_factory
+
     def register_repository(self, value_type: Type, repository: Callable):
         self._repos[value_type] = repository
 
-    async def __aenter__(self):
-        self.session = self.session_factory()
+    def on_commit(self, hook: Callable[[], None]):
+        # Runs after the transaction is committed, dropped on rollback
+        self._commit_hooks.append(hook)
 
-        for value_type, repo in self._repos.items():
-            self.repositories[value_type] = repo(self.session)
+    def _run_commit_hooks(self):
+        hooks, self._commit_hooks = self._commit_hooks, []
+        for hook in hooks:
+            hook()
+
+    async def __aenter__(self):
+        if self._depth == 0:
+            self._failed = False
 
+        self._depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+
+        # An error in a nested block dooms the whole unit even if an outer block swallows it
         if exc_val:
-            await self.session.rollback()
-        else:
-            await self.session.commit()
+            self._failed = True
+            self._connection_failed |= _is_connection_failure(exc_val)
+
+        if self._depth > 0:
+            return
+
+        try:
+            if isinstance(exc_val, (asyncio.CancelledError, asyncio.TimeoutError)):
+                # Cancelled mid-query: the connection may still be busy with the
+                # statement, so it is thrown away rather than rolled back and reused
+                await self.invalidate()
+            elif self._failed:
+                await self.rollback()
+            else:
+                await self.commit()
+        except BaseException as exc:
+            if not _is_connection_failure(exc):
+                raise
+            self._connection_failed = True
+            exc_val = exc
+        finally:
+            connection_failed = self._connection_failed
+            breaker = self._report_outcome(cancelled=isinstance(exc_val, asyncio.CancelledError))
+            await self._release()
+
+        if connection_failed and breaker is not None:
+            raise DatabaseUnavailable(breaker.retry_after()) from exc_val
 
-        await self.session.close()
+        if _is_statement_timeout(exc_val) and deadline.remaining() is not None:
+            raise DeadlineExceeded() from exc_val
 
     async def commit(self):
-        await self.session.commit()
+        # Read-only units have nothing to persist. Closing the session ends their
+        # transaction with the pool's ROLLBACK, still a round trip, but unlike
+        # session.rollback() it leaves the loaded objects usable after the unit
+        if self._session is not None and not self.read_only:
+            await self._session.commit()
+
+        self._run_commit_hooks()
 
     async def rollback(self):
-        await self.session.rollback()
+        self._commit_hooks.clear()
+
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def invalidate(self):
+        self._commit_hooks.clear()
+
+        if self._session is not None:
+            await self._session.invalidate()
+
+    def _report_outcome(self, cancelled: bool):
+        breaker, self._breaker = self._breaker, None
+        if breaker is not None:
+            # A cancelled unit says nothing about the database, it just frees its probe slot
+            failed = None if cancelled and not self._connection_failed else self._connection_failed
+            breaker.release(self._probe, failed)
+
+        self._probe = False
+        self._connection_failed = False
+        return breaker
+
+    async def _release(self):
+        session, self._session = self._session, None
+        self.repositories.clear()
+
+        if session is not None:
+            await session.close()
 
     @classmethod
-    def create_with_repositories(cls, session_factory, repositories: dict[Type, Callable]):
-        instance = cls(session_factory)
+    def create_with_repositories(
+        cls,
+        session_factory,
+        repositories: dict[Type, Callable],
+        read_only: bool = False,
+        replica_session_factory=None,
+    ):
+        instance = cls(session_factory, read_only, replica_session_factory)
         for value_type, repo in repositories.items():
             instance.register_repository(value_type, repo)
         return instance
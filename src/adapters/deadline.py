@@ -0,0 +1,42 @@
+import asyncio
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Event loop time by which the current request has to start responding
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+def start(timeout: float) -> Token:
+    return _deadline.set(asyncio.get_running_loop().time() + timeout)
+
+
+def clear():
+    _deadline.set(None)
+
+
+def reset(token: Token):
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - asyncio.get_running_loop().time()
+
+
+class DeadlineSession(Session):
+    pass
+
+
+@event.listens_for(DeadlineSession, "after_begin")
+def apply_statement_timeout(session, transaction, connection):
+    # Postgres stops the statement itself once the request is out of time,
+    # instead of it running on after the client got its 504
+    budget = remaining()
+    if budget is not None:
+        timeout_ms = max(int(budget * 1000), 1)
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
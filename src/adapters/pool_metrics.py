@@ -0,0 +1,132 @@
+import math
+import time
+from typing import Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from src.config import settings
+from src.exceptions.base import ServiceOverloaded
+
+# Weight of the latest checkout in the moving average of waits
+RECENT_WAIT_WEIGHT = 0.2
+
+
+class CheckoutTiming:
+    # Records how long callers waited for a connection
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.recent_wait = 0.0
+
+    def connect(self):
+        started = time.perf_counter()
+
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            self.recent_wait += (waited - self.recent_wait) * RECENT_WAIT_WEIGHT
+
+    def timing_stats(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": self.wait_total / self.checkouts * 1000 if self.checkouts else 0.0,
+            "wait_max_ms": self.wait_max * 1000,
+            "recent_wait_ms": self.recent_wait * 1000,
+        }
+
+
+class InstrumentedAsyncPool(CheckoutTiming, AsyncAdaptedQueuePool):
+    # Admission control: the pool caps connections, and so the units of work
+    # running at once. Once it is exhausted a caller only queues up while the
+    # queue is short and recent waits are within budget, otherwise it is turned
+    # away at once rather than held until the pool timeout
+    def __init__(
+        self,
+        *args,
+        queue_size: Optional[int] = None,
+        max_wait: Optional[float] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+
+        self.queue_size = settings.db_admission_queue_size if queue_size is None else queue_size
+        self.max_wait = settings.db_admission_max_wait if max_wait is None else max_wait
+
+        self.waiting = 0
+        self.shed = 0
+
+    def _exhausted(self) -> bool:
+        unbounded = self._max_overflow == -1
+        return self.checkedin() == 0 and not unbounded and self.overflow() >= self._max_overflow
+
+    def connect(self):
+        if not self._exhausted():
+            return super().connect()
+
+        queue_full = 0 < self.queue_size <= self.waiting
+        too_slow = 0 < self.max_wait < self.recent_wait
+
+        if queue_full or too_slow:
+            self.shed += 1
+            # Callers ahead of this one waited about this long
+            raise ServiceOverloaded(retry_after=max(math.ceil(self.recent_wait), 1))
+
+        self.waiting += 1
+        try:
+            return super().connect()
+        finally:
+            self.waiting -= 1
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "waiting": self.waiting,
+            "shed": self.shed,
+            **self.timing_stats(),
+        }
+
+
+class InstrumentedNullPool(CheckoutTiming, NullPool):
+    # Pooler mode: every checkout opens a connection to PgBouncer and closes it on return
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.opened = 0
+
+    def _do_get(self):
+        connection = super()._do_get()
+        self.opened += 1
+        return connection
+
+    def _do_return_conn(self, record):
+        self.opened -= 1
+        super()._do_return_conn(record)
+
+    def stats(self) -> dict:
+        return {
+            "size": 0,
+            "checked_out": self.opened,
+            "idle": 0,
+            "overflow": 0,
+            "max_overflow": 0,
+            "waiting": 0,
+            "shed": 0,
+            **self.timing_stats(),
+        }
@@ -0,0 +1,166 @@
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from src.config import settings
+
+
+class StatsCache:
+    # LRU + TTL cache of board results, local to the worker process
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[uuid.UUID, tuple[float, Any]] = OrderedDict()
+        # Board versions behind the ETags, dropped together with the results
+        self._versions: OrderedDict[uuid.UUID, tuple[float, str]] = OrderedDict()
+
+        # Per-board generation, bumped on every invalidation of that board so a
+        # read that started before a write can't put stale results back after
+        # the write invalidated them. Bounded like the entries: boards without
+        # one share the highest generation dropped so far
+        self._generations: OrderedDict[uuid.UUID, int] = OrderedDict()
+        self._last_generation = 0
+        self._dropped_generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, board_id: uuid.UUID) -> Optional[Any]:
+        value = self._lookup(self._entries, board_id)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def get_version(self, board_id: uuid.UUID) -> Optional[str]:
+        return self._lookup(self._versions, board_id)
+
+    def generation(self, board_id: uuid.UUID) -> int:
+        return self._generations.get(board_id, self._dropped_generation)
+
+    def set(self, board_id: uuid.UUID, value: Any, generation: Optional[int] = None):
+        if generation is not None and generation != self.generation(board_id):
+            return
+
+        self.evictions += self._store(self._entries, board_id, value)
+
+    def set_version(self, board_id: uuid.UUID, version: str, generation: Optional[int] = None):
+        if generation is not None and generation != self.generation(board_id):
+            return
+
+        # Results cached under another or an unknown version would go out with the wrong ETag
+        if self._lookup(self._versions, board_id) != version:
+            self._entries.pop(board_id, None)
+
+        self._store(self._versions, board_id, version)
+
+    def invalidate(self, board_id: uuid.UUID):
+        self._last_generation += 1
+        self._generations[board_id] = self._last_generation
+        self._generations.move_to_end(board_id)
+
+        while len(self._generations) > self.max_size:
+            _, dropped = self._generations.popitem(last=False)
+            self._dropped_generation = max(self._dropped_generation, dropped)
+
+        self._entries.pop(board_id, None)
+        self._versions.pop(board_id, None)
+
+    def clear(self):
+        self._last_generation += 1
+        self._dropped_generation = self._last_generation
+        self._generations.clear()
+        self._entries.clear()
+        self._versions.clear()
+
+    def _lookup(self, entries: OrderedDict, board_id: uuid.UUID) -> Optional[Any]:
+        entry = entries.get(board_id)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del entries[board_id]
+            return None
+
+        entries.move_to_end(board_id)
+        return value
+
+    def _store(self, entries: OrderedDict, board_id: uuid.UUID, value: Any) -> int:
+        # Returns how many entries were evicted to make room
+        entries[board_id] = (self._clock() + self.ttl, value)
+        entries.move_to_end(board_id)
+
+        evicted = 0
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def stats(self) -> dict:
+        return {
+            "enabled": True,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class NullStatsCache:
+    # Drop-in replacement that never caches, used when the cache is disabled
+    def get(self, board_id: uuid.UUID) -> Optional[Any]:
+        return None
+
+    def get_version(self, board_id: uuid.UUID) -> Optional[str]:
+        return None
+
+    def generation(self, board_id: uuid.UUID) -> int:
+        return 0
+
+    def set(self, board_id: uuid.UUID, value: Any, generation: Optional[int] = None):
+        pass
+
+    def set_version(self, board_id: uuid.UUID, version: str, generation: Optional[int] = None):
+        pass
+
+    def invalidate(self, board_id: uuid.UUID):
+        pass
+
+    def clear(self):
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "enabled": False,
+            "size": 0,
+            "max_size": 0,
+            "ttl": 0.0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+
+def create_stats_cache():
+    if settings.stats_cache_size <= 0:
+        return NullStatsCache()
+
+    return StatsCache(max_size=settings.stats_cache_size, ttl=settings.stats_cache_ttl)
+
+
+# Синглетон кэша статистики для приложения
+stats_cache = create_stats_cache()
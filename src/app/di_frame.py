@@ -1,18 +1,82 @@
+import hashlib
+import hmac
+import secrets
+import time
 from typing import AsyncGenerator
 
+from fastapi import Depends, Request, Response
+
 from src.adapters.db_work_unit import DBWorkUnit
-from src.app.storage_setup import async_session_factory
+from src.app.storage_setup import (
+    async_session_factory,
+    next_replica_session_factory,
+    replica_session_factories,
+)
+from src.config import settings
 from src.domain.models.board import Board
 from src.domain.models.idea import Idea
+from src.domain.models.snapshot import BoardSnapshot
 from src.domain.models.user import User
 from src.domain.models.vote import Vote
+from src.middleware.ratelimits import RateLimitExceeded, client_key, limiter
 from src.repositories.board_repo import BoardRepository
 from src.repositories.idea_repo import IdeaRepository
+from src.repositories.snapshot_repo import SnapshotRepository
 from src.repositories.user_repo import UserRepository
 from src.repositories.vote_repo import VoteRepository
 
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Holds the unix time until which the client reads from the primary, signed so
+# clients can't pin themselves there indefinitely
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+
+def _sticky_secret() -> bytes:
+    if settings.replica_stickiness_secret:
+        return settings.replica_stickiness_secret.encode()
+
+    # Each worker would sign with its own key and reject the others' cookies,
+    # silently sending clients that just wrote to a lagging replica
+    if replica_session_factories:
+        raise RuntimeError("REPLICA_STICKINESS_SECRET must be set when read replicas are used")
+
+    # Without replicas no cookie is ever issued
+    return secrets.token_bytes(32)
 
-def create_uow() -> DBWorkUnit:
+
+_STICKY_SECRET = _sticky_secret()
+
+
+def _sign(until: str) -> str:
+    return hmac.new(_STICKY_SECRET, until.encode(), hashlib.sha256).hexdigest()
+
+
+def pin_to_primary(response: Response):
+    # Keeps the client's next reads on the primary until replicas catch up with its write
+    window = settings.replica_stickiness_seconds
+    until = f"{time.time() + window:.3f}"
+    response.set_cookie(
+        PRIMARY_STICKY_COOKIE,
+        f"{until}.{_sign(until)}",
+        max_age=max(int(window), 1),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    until, _, signature = request.cookies.get(PRIMARY_STICKY_COOKIE, "").rpartition(".")
+    if not hmac.compare_digest(signature.encode(), _sign(until).encode()):
+        return False
+
+    try:
+        return float(until) > time.time()
+    except ValueError:
+        return False
+
+
+def create_uow(read_only: bool = False, replica_session_factory=None) -> DBWorkUnit:
     uow = DBWorkUnit.create_with_repositories(
         async_session_factory,
         {
@@ -20,12 +84,37 @@ def create_uow() -> DBWorkUnit:
             Idea: IdeaRepository,
             User: UserRepository,
             Vote: VoteRepository,
+            BoardSnapshot: SnapshotRepository,
         },
+        read_only,
+        replica_session_factory,
     )
     return uow
 
 
-async def get_uow() -> AsyncGenerator[DBWorkUnit, None]:
-    uow = create_uow()
+async def get_uow(request: Request, response: Response) -> AsyncGenerator[DBWorkUnit, None]:
+    read_only = request.method in READ_ONLY_METHODS
+    pinned = read_only and is_pinned_to_primary(request)
+    replica = None
+
+    if read_only and not pinned:
+        replica = next_replica_session_factory()
+    elif not read_only and replica_session_factories:
+        pin_to_primary(response)
+
+    uow = create_uow(read_only, replica)
+    uow.pinned_to_primary = pinned
     async with uow:
         yield uow
+
+
+def rate_limited(write_cost: int = settings.rate_limit_write_cost):
+    # Router dependency: reads cost one unit of the client's budget, writes `write_cost`
+    async def check_rate_limit(request: Request):
+        cost = 1 if request.method in READ_ONLY_METHODS else write_cost
+
+        retry_after = await limiter.hit(client_key(request), cost)
+        if retry_after is not None:
+            raise RateLimitExceeded(retry_after)
+
+    return Depends(check_rate_limit)
@@ -1,21 +1,28 @@
+import logging
 import os
 import uuid
+from typing import Optional
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-from slowapi.errors import RateLimitExceeded
+from sqlalchemy import text
 
+from src.adapters.circuit_breaker import CircuitState, breaker_for
 from src.adapters.logger import logger, mask_pii
+from src.app.di_frame import create_uow
 from src.app.routers import router
+from src.app.storage_setup import async_session_factory
+from src.config import settings
 from src.exceptions.base import ApiException
 from src.middleware.cors_policy import SecurityHeadersMiddleware
 from src.middleware.ratelimits import (
+    RateLimitExceeded,
     RequestTimeoutMiddleware,
     create_rate_limit_response,
-    get_limiter,
+    parse_route_timeouts,
 )
 
 app = FastAPI(title="Secure Team Voting Board", version="0.10.1")
@@ -67,11 +74,11 @@ app.add_middleware(
 app.add_middleware(SecurityHeadersMiddleware, environment=ENVIRONMENT)
 
 
-# Rate Limiting Middleware
-limiter = get_limiter()
-app.state.limiter = limiter
-
-app.add_middleware(RequestTimeoutMiddleware, timeout=30.0)
+app.add_middleware(
+    RequestTimeoutMiddleware,
+    timeout=settings.request_timeout,
+    route_timeouts=parse_route_timeouts(settings.route_timeouts),
+)
 
 
 @app.exception_handler(RateLimitExceeded)
@@ -82,10 +89,18 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
 ## Errors handling
 
 
-def format_to_RFC(status: int, title: str, detail: str, error_type: str = "about:blank"):
+def format_to_RFC(
+    status: int,
+    title: str,
+    detail: str,
+    error_type: str = "about:blank",
+    headers: Optional[dict[str, str]] = None,
+    log_level: int = logging.ERROR,
+):
     corr_id = str(uuid.uuid4())
 
-    logger.error(
+    logger.log(
+        log_level,
         f"API raised an error with code: {status}",
         extra={
             "type": error_type,
@@ -106,6 +121,7 @@ def format_to_RFC(status: int, title: str, detail: str, error_type: str = "about
             "correlation_id": corr_id,
         },
         media_type="application/problem+json",
+        headers=headers,
     )
 
 
@@ -129,6 +145,8 @@ async def api_error_handler(request: Request, exc: ApiException):
         title=exc.code,
         detail=exc.message,
         error_type=f"/errors/{exc.code}",
+        headers=exc.headers,
+        log_level=exc.log_level,
     )
 
 
@@ -149,3 +167,15 @@ app.include_router(router)
 @app.get("/health")
 async def health(request: Request):
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def ready(request: Request):
+    # Answers from the breaker while the primary is healthy; otherwise the check
+    # is itself a unit of work, so at most one probe reaches a recovering database
+    breaker = breaker_for(async_session_factory)
+    if breaker.state != CircuitState.closed:
+        async with create_uow() as uow:
+            await uow.session.execute(text("SELECT 1"))
+
+    return {"status": "ready", "database": breaker.state.value}
@@ -1,13 +1,83 @@
+import uuid
+from itertools import cycle
+
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from src.adapters.deadline import DeadlineSession
+from src.adapters.pool_metrics import InstrumentedAsyncPool, InstrumentedNullPool
 from src.config import settings
 
-db_url = settings.database_url
-if db_url.startswith("postgresql://"):
-    db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-elif db_url.startswith("postgres://"):
-    db_url = db_url.replace("postgres://", "postgresql+asyncpg://", 1)
 
-engine = create_async_engine(db_url, echo=settings.echo_sql)
+def to_async_url(url: str) -> str:
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    elif url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def create_pooler_engine(url: str):
+    # PgBouncer hands each transaction to any backend, so statements prepared
+    # on one can't be looked up by name on the next
+    return create_async_engine(
+        to_async_url(url),
+        echo=settings.echo_sql,
+        poolclass=InstrumentedNullPool,
+        connect_args={
+            "timeout": settings.db_connect_timeout,
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": unique_statement_name,
+        },
+    )
+
+
+def create_engine(url: str):
+    if settings.db_pooler_mode:
+        return create_pooler_engine(url)
+
+    return create_async_engine(
+        to_async_url(url),
+        echo=settings.echo_sql,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            "timeout": settings.db_connect_timeout,
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+
+
+db_url = to_async_url(settings.database_url)
+
+engine = create_engine(db_url)
+
+async_session_factory = async_sessionmaker(
+    engine, expire_on_commit=False, sync_session_class=DeadlineSession
+)
+
+replica_engines = [
+    create_engine(url.strip()) for url in settings.database_replica_urls.split(",") if url.strip()
+]
+
+replica_session_factories = [
+    async_sessionmaker(replica, expire_on_commit=False, sync_session_class=DeadlineSession)
+    for replica in replica_engines
+]
+_replica_rotation = cycle(replica_session_factories)
+
 
-async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+def next_replica_session_factory():
+    # Round-robin over replicas, None when the app runs against the primary only
+    if not replica_session_factories:
+        return None
+    return next(_replica_rotation)
@@ -11,3 +11,10 @@ USER_NAME_PATTERN = r"^[a-zA-Z0-9а-яА-ЯёЁ\s_-]+$"  # буквы, цифр
 IDEA_TITLE_MIN_LENGTH = 1
 IDEA_TITLE_MAX_LENGTH = 150
 IDEA_DESC_MAX_LENGTH = 2000
+
+# Pagination
+PAGE_DEFAULT_LIMIT = 50
+PAGE_MAX_LIMIT = 200
+
+# Streaming exports: rows fetched per server-side cursor round trip
+EXPORT_BATCH_SIZE = 1000
@@ -1,7 +1,7 @@
 import uuid
 from typing import List
 
-from sqlalchemy import Enum as sql_enum, String
+from sqlalchemy import Enum as sql_enum, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -9,13 +9,14 @@ from src.board_status import BoardStatus
 
 from .base import Base
 from .idea import Idea
+from .ids import uuid7
 
 
 class Board(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     title: Mapped[str] = mapped_column(
@@ -29,6 +30,15 @@ class Board(Base):
         nullable=False,
     )
 
+    # Bumped by status and idea changes; with a digest of the vote counters it
+    # makes up the ETag, so votes never have to write to the board row
+    version: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        nullable=False,
+    )
+
     ideas: Mapped[List["Idea"]] = relationship(
         back_populates="board",
     )
@@ -3,11 +3,12 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .ids import uuid7
 
 if TYPE_CHECKING:
     from .board import Board
@@ -15,10 +16,13 @@ if TYPE_CHECKING:
 
 
 class Idea(Base):
+    # Keyset pagination over a board's ideas
+    __table_args__ = (Index("ix_idea_board_id_id", "board_id", "id"),)
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     title: Mapped[str] = mapped_column(
@@ -37,6 +41,14 @@ class Idea(Base):
         nullable=False,
     )
 
+    # Maintained by VoteRepository in the same statement as each vote insert/delete
+    votes_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+
     board: Mapped["Board"] = relationship("Board", back_populates="ideas")  # noqa: F821
 
     votes: Mapped[List["Vote"]] = relationship("Vote", back_populates="idea")  # noqa: F821
@@ -0,0 +1,41 @@
+import os
+import threading
+import time
+import uuid
+
+# RFC 9562 UUIDv7: 48-bit unix time in ms, then a 12-bit counter that keeps ids
+# generated within the same millisecond ordered, then 62 random bits
+_COUNTER_MAX = 0xFFF
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def _next_timestamp() -> tuple[int, int]:
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Random start in the lower half leaves room for the ids that follow
+            _counter = int.from_bytes(os.urandom(2), "big") & (_COUNTER_MAX >> 1)
+        elif _counter < _COUNTER_MAX:
+            _counter += 1
+        else:
+            # Counter exhausted or clock went back: borrow the next millisecond
+            _last_ms += 1
+            _counter = 0
+
+        return _last_ms, _counter
+
+
+def uuid7() -> uuid.UUID:
+    timestamp_ms, counter = _next_timestamp()
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+
+    return uuid.UUID(
+        int=(timestamp_ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random_bits
+    )
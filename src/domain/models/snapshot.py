@@ -0,0 +1,28 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class BoardSnapshot(Base):
+    # Results of a closed board, frozen at the moment it was closed
+    __tablename__ = "board_snapshot"
+
+    board_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("board.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    total_votes: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+
+    ideas: Mapped[list] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
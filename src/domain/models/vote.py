@@ -1,19 +1,28 @@
 import uuid
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
 from .idea import Idea
+from .ids import uuid7
 from .user import User
 
 
 class Vote(Base):
+    __table_args__ = (
+        UniqueConstraint("board_id", "user_id", name="uq_vote_board_user"),
+        # Keyset pagination over a user's vote history
+        Index("ix_vote_user_id_id", "user_id", "id"),
+        # Counter reconciliation and the idea delete cascade
+        Index("ix_vote_idea_id", "idea_id"),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     idea_id: Mapped[uuid.UUID] = mapped_column(
@@ -28,6 +37,13 @@ class Vote(Base):
         nullable=False,
     )
 
+    # Denormalized from idea.board_id so one-vote-per-board is enforced by the database
+    board_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("board.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
     user: Mapped["User"] = relationship(
         back_populates="votes",
     )
@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+
+
+class StatsCacheMetrics(BaseModel):
+    enabled: bool
+    size: int
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+    evictions: int
+
+
+class PoolMetrics(BaseModel):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    max_overflow: int
+    waiting: int
+    shed: int
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
+    recent_wait_ms: float
+
+
+class DatabasePoolMetrics(BaseModel):
+    primary: PoolMetrics
+    replicas: list[PoolMetrics]
+
+
+class TimeoutMetrics(BaseModel):
+    total: int
+    routes: dict[str, int]
+
+
+class CircuitBreakerMetrics(BaseModel):
+    state: str
+    calls: int
+    failure_rate: float
+    opened: int
+    rejected: int
+
+
+class DatabaseCircuitBreakerMetrics(BaseModel):
+    primary: CircuitBreakerMetrics
+    replicas: list[CircuitBreakerMetrics]
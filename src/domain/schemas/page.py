@@ -0,0 +1,42 @@
+import base64
+import binascii
+import uuid
+from typing import Callable, Generic, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+from src.exceptions.pagination import InvalidCursor
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(last_id: uuid.UUID) -> str:
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[uuid.UUID]:
+    if cursor is None:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return uuid.UUID(bytes=raw)
+    except (binascii.Error, ValueError):
+        raise InvalidCursor()
+
+
+def build_page(rows: Sequence, limit: int, key: Callable = lambda row: row.id) -> Page:
+    # Repositories are asked for limit + 1 rows: the extra one only signals that
+    # another page exists and is never returned
+    items = list(rows[:limit])
+
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(key(items[-1]))
+
+    return Page(items=items, next_cursor=next_cursor)
@@ -16,3 +16,19 @@ class Percentages(BaseModel):
 class Winners(BaseModel):
     id: list[uuid.UUID]
     winners_count: int
+
+
+class IdeaResult(BaseModel):
+    id: uuid.UUID
+    votes_count: int
+    percent_votes: float
+    rank: int
+    is_winner: bool
+
+
+class BoardResults(BaseModel):
+    board_id: uuid.UUID
+    total_votes: int
+    ideas: list[IdeaResult]
+    # True once the board is closed and the results can no longer change
+    final: bool = False
@@ -1,3 +1,4 @@
+import logging
 from typing import Optional, Type
 
 
@@ -5,6 +6,8 @@ class ApiException(Exception):
     status_code = 400
     code = "unidentified_api_exception"
     message = "Something went wrong"
+    headers: Optional[dict[str, str]] = None
+    log_level = logging.ERROR
 
     def __init__(self, message: Optional[str] = None):
         if message:
@@ -20,3 +23,39 @@ class NotFoundException(ApiException):
     def __init__(self, obj_type: Optional[Type] = None):
         if obj_type:
             self.object_type = obj_type
+
+
+class Unauthorized(ApiException):
+    status_code = 401
+    code = "unauthorized"
+    message = "Missing or invalid credentials."
+
+
+class DeadlineExceeded(ApiException):
+    status_code = 504
+    code = "timeout"
+    message = "Request processing exceeded its time budget."
+
+
+class ServiceOverloaded(ApiException):
+    status_code = 503
+    code = "service_overloaded"
+    message = "Too many requests are waiting for the database, retry later."
+    # Load shedding answers many requests at once, one error each would flood the log
+    log_level = logging.WARNING
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        self.headers = {"Retry-After": str(retry_after)}
+
+
+class DatabaseUnavailable(ApiException):
+    status_code = 503
+    code = "database_unavailable"
+    message = "The database is unavailable, retry later."
+    # Sent to every request while the breaker is open, which logs its own transitions
+    log_level = logging.WARNING
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        self.headers = {"Retry-After": str(retry_after)}
@@ -0,0 +1,7 @@
+from src.exceptions.base import ApiException
+
+
+class InvalidCursor(ApiException):
+    status_code = 400
+    code = "invalid_pagination_cursor"
+    message = "Pagination cursor is malformed. Use next_cursor from a previous page as is"
@@ -1,22 +1,40 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+SECURITY_HEADERS = {
+    "X-Frame-Options": "DENY",
+    "X-Content-Type-Options": "nosniff",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+}
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, environment: str = "development"):
-        super().__init__(app)
+
+class SecurityHeadersMiddleware:
+    # Plain ASGI: headers are added to http.response.start, the body passes through untouched
+    def __init__(self, app: ASGIApp, environment: str = "development"):
+        self.app = app
         self.environment = environment
 
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
+        headers = dict(SECURITY_HEADERS)
+        if environment == "production":
+            headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+
+        self.headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        ]
+        self.names = {name for name, _ in self.headers}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                # Ours win over whatever the endpoint set, same as assigning them
+                raw = [item for item in message.get("headers", ()) if item[0] not in self.names]
+                message["headers"] = raw + self.headers
 
-        if self.environment == "production":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
@@ -1,56 +1,178 @@
 import asyncio
+import math
+import time
 import uuid
+from collections import Counter
+from typing import Optional
 
-from slowapi import Limiter
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
-from starlette.middleware.base import BaseHTTPMiddleware
+from limits import parse
+from limits.aio.strategies import SlidingWindowCounterRateLimiter
+from limits.errors import StorageError
+from limits.storage import storage_from_string
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.adapters import deadline
+from src.adapters.logger import logger
+from src.config import settings
 
-def get_limiter():
-    return Limiter(
-        key_func=get_remote_address,
-        default_limits=["100/minute"],
-    )
 
+class RateLimitExceeded(Exception):
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
 
-def create_rate_limit_response(request: Request, exc: RateLimitExceeded) -> JSONResponse:
-    retry_after = 60
 
+class RateLimiter:
+    # Sliding window counter per client. The storage decides the scope: memory
+    # is per worker, a Redis-compatible server is shared by every worker
+    def __init__(self, limit: str, storage_uri: str):
+        options = {"implementation": "redispy"} if "redis" in storage_uri.split("://")[0] else {}
+
+        self.item = parse(limit)
+        self.storage = storage_from_string(storage_uri, wrap_exceptions=True, **options)
+        self.strategy = SlidingWindowCounterRateLimiter(self.storage)
+
+    async def hit(self, key: str, cost: int = 1) -> Optional[int]:
+        # None when allowed, otherwise seconds until the window has room again
+        try:
+            if await self.strategy.hit(self.item, key, cost=cost):
+                return None
+
+            stats = await self.strategy.get_window_stats(self.item, key)
+        except StorageError as exc:
+            # An unreachable store must not take the API down with it
+            logger.warning(f"Rate limit storage unavailable: {exc}")
+            return None
+
+        return max(math.ceil(stats.reset_time - time.time()), 1)
+
+
+limiter = RateLimiter(settings.rate_limit, settings.rate_limit_storage_uri)
+
+
+def client_key(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+def create_rate_limit_response(request: Request, exc: RateLimitExceeded) -> JSONResponse:
     return JSONResponse(
         status_code=429,
         content={
             "type": "/errors/too_many_requests",
             "title": "Too Many Requests",
             "status": 429,
-            "detail": f"Rate limit exceeded. Please retry after {retry_after} seconds.",
+            "detail": f"Rate limit exceeded. Please retry after {exc.retry_after} seconds.",
             "correlation_id": str(uuid.uuid4()),
         },
-        headers={"Retry-After": str(retry_after)},
+        headers={"Retry-After": str(exc.retry_after)},
     )
 
 
-class RequestTimeoutMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, timeout: float = 30.0):
-        super().__init__(app)
+# Requests answered with 504, by route
+timeout_counts: Counter = Counter()
+
+
+def parse_route_timeouts(value: str) -> dict[str, float]:
+    # "/boards/export=120,/metrics=5": path prefix to timeout in seconds
+    timeouts = {}
+    for item in value.split(","):
+        if item.strip():
+            prefix, seconds = item.rsplit("=", 1)
+            timeouts[prefix.strip()] = float(seconds)
+    return timeouts
+
+
+def route_label(scope: Scope) -> str:
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return f"{scope['method']} {route.path}"
+    return f"{scope['method']} {scope['path']}"
+
+
+class RequestTimeoutMiddleware:
+    # Plain ASGI: the deadline covers the app until it starts responding, after
+    # that the body (streamed exports included) is never cut off half-way. The
+    # remaining budget is published to the unit of work as a statement timeout
+    def __init__(
+        self,
+        app: ASGIApp,
+        timeout: float = 30.0,
+        route_timeouts: Optional[dict[str, float]] = None,
+    ):
+        self.app = app
         self.timeout = timeout
+        # Longest prefix first, so the most specific one wins
+        self.route_timeouts = sorted(
+            (route_timeouts or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def timeout_for(self, path: str) -> float:
+        for prefix, timeout in self.route_timeouts:
+            if path.startswith(prefix):
+                return timeout
+        return self.timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self.timeout_for(scope["path"])
+        started = False
+        timed_out = False
+        token = deadline.start(timeout)
+
+        # Cancels this task once the budget runs out, asyncio.timeout is 3.11+ only
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+
+        def expire():
+            nonlocal timed_out
+            timed_out = True
+            task.cancel()
+
+        request_deadline = loop.call_later(timeout, expire)
+
+        async def send_until_started(message: Message):
+            nonlocal started
+
+            if message["type"] == "http.response.start":
+                started = True
+                request_deadline.cancel()
+                deadline.clear()
+
+                # Postgres gave up first and the handler reported it
+                if message["status"] == 504:
+                    timeout_counts[route_label(scope)] += 1
+
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next):
         try:
-            response = await asyncio.wait_for(call_next(request), timeout=self.timeout)
-            return response
+            await self.app(scope, receive, send_until_started)
+
+        except asyncio.CancelledError:
+            if started or not timed_out:
+                raise
+            if hasattr(task, "uncancel"):
+                task.uncancel()
 
-        except asyncio.TimeoutError:
+            timeout_counts[route_label(scope)] += 1
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=504,
                 content={
                     "type": "errors/timeout",
                     "title": "Gateway Timeout",
                     "status": 504,
-                    "detail": f"Request processing exceeded {self.timeout} seconds timeout.",
+                    "detail": f"Request processing exceeded {timeout} seconds timeout.",
                     "correlation_id": str(uuid.uuid4()),
                 },
             )
+            await response(scope, receive, send)
+        finally:
+            request_deadline.cancel()
+            deadline.reset(token)
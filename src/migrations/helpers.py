@@ -0,0 +1,97 @@
+# Helpers for migrations that must not block writes on large tables. The ones
+# that can't run inside a transaction open an autocommit block, which relies on
+# transaction_per_migration in env.py
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def _index_is_valid(name: str):
+    # None when the index doesn't exist, False when a concurrent build was interrupted
+    return (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT index.indisvalid FROM pg_index AS index"
+                " JOIN pg_class AS relation ON relation.oid = index.indexrelid"
+                " WHERE relation.relname = :name AND pg_catalog.pg_table_is_visible(relation.oid)"
+            ),
+            {"name": name},
+        )
+        .scalar_one_or_none()
+    )
+
+
+def create_index_concurrently(name: str, table: str, columns: Sequence[str], **kw) -> None:
+    with op.get_context().autocommit_block():
+        # A build that failed half-way leaves an INVALID index, rebuild it on re-run
+        if _index_is_valid(name) is False:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+        op.create_index(
+            name, table, list(columns), postgresql_concurrently=True, if_not_exists=True, **kw
+        )
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def add_foreign_key_not_valid(
+    name: str,
+    source: str,
+    referent: str,
+    local_cols: Sequence[str],
+    remote_cols: Sequence[str],
+    **kw,
+) -> None:
+    # Enforced for new rows right away, existing rows are checked by validate_constraint
+    op.create_foreign_key(
+        name, source, referent, list(local_cols), list(remote_cols), postgresql_not_valid=True, **kw
+    )
+
+
+def add_check_not_valid(name: str, table: str, condition: str) -> None:
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" CHECK ({condition}) NOT VALID')
+
+
+def validate_constraint(table: str, name: str) -> None:
+    # Runs in its own transaction so the lock it takes is released right after
+    with op.get_context().autocommit_block():
+        op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{name}"')
+
+
+def set_not_null(table: str, column: str) -> None:
+    # SET NOT NULL skips its full-table scan once a validated check proves it
+    name = f"ck_{table}_{column}_not_null"
+    add_check_not_valid(name, table, f'"{column}" IS NOT NULL')
+    validate_constraint(table, name)
+    op.alter_column(table, column, nullable=False)
+    op.drop_constraint(name, table, type_="check")
+
+
+def add_unique_constraint_concurrently(name: str, table: str, columns: Sequence[str]) -> None:
+    create_index_concurrently(name, table, columns, unique=True)
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" UNIQUE USING INDEX "{name}"')
+
+
+def batched_backfill(
+    table: str, assignments: str, pending: str, batch_size: int = 10000, key: str = "id"
+) -> int:
+    # Every batch commits on its own, so row locks are short and an interrupted
+    # backfill resumes where it stopped. `pending` must stop matching updated rows
+    statement = sa.text(
+        f'UPDATE "{table}" SET {assignments}'
+        f' WHERE "{key}" IN (SELECT "{key}" FROM "{table}" WHERE {pending} LIMIT :batch_size)'
+    )
+
+    updated = 0
+    with op.get_context().autocommit_block():
+        while True:
+            result = op.get_bind().execute(statement, {"batch_size": batch_size})
+            updated += result.rowcount
+
+            if result.rowcount < batch_size:
+                return updated
@@ -0,0 +1,48 @@
+"""Add incrementally maintained vote counter to idea
+
+Revision ID: 1a483c5d64cd
+Revises: 7ccc1392460c
+Create Date: 2026-10-18 14:41:53.107692
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.migrations.helpers import (
+    batched_backfill,
+    create_index_concurrently,
+    drop_index_concurrently,
+    set_not_null,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "1a483c5d64cd"
+down_revision: Union[str, Sequence[str], None] = "7ccc1392460c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Added without a default first, so rows still to be counted stay NULL;
+    # the default then only applies to ideas created from here on
+    op.add_column("idea", sa.Column("votes_count", sa.Integer(), nullable=True))
+    op.alter_column("idea", "votes_count", server_default="0")
+
+    # Each idea is counted through an index rather than a scan of every vote
+    create_index_concurrently("ix_vote_idea_id", "vote", ["idea_id"])
+    batched_backfill(
+        "idea",
+        "votes_count = (SELECT count(*) FROM vote WHERE vote.idea_id = idea.id)",
+        "votes_count IS NULL",
+    )
+    set_not_null("idea", "votes_count")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently("ix_vote_idea_id", "vote")
+    op.drop_column("idea", "votes_count")
@@ -0,0 +1,30 @@
+"""Index votes by idea
+
+Revision ID: 3f0c2a7d9e41
+Revises: b752eb528b2d
+Create Date: 2026-10-18 16:05:42.118305
+
+1a483c5d64cd now builds this index for its counter backfill, so this is a
+no-op unless that revision was applied before it did. The index is dropped
+with that revision's downgrade.
+
+"""
+
+from typing import Sequence, Union
+
+from src.migrations.helpers import create_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "3f0c2a7d9e41"
+down_revision: Union[str, Sequence[str], None] = "b752eb528b2d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_concurrently("ix_vote_idea_id", "vote", ["idea_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
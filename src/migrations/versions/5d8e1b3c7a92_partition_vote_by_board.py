@@ -0,0 +1,88 @@
+"""Optionally hash-partition votes by board
+
+Revision ID: 5d8e1b3c7a92
+Revises: 3f0c2a7d9e41
+Create Date: 2026-10-18 18:12:09.530417
+
+Opt-in: does nothing unless VOTE_PARTITIONS is set when upgrading. The table is
+copied under an exclusive lock, so run it in a maintenance window on big
+databases. The primary key becomes (id, board_id) because Postgres requires the
+partition key in every unique constraint of a partitioned table.
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8e1b3c7a92"
+down_revision: Union[str, Sequence[str], None] = "3f0c2a7d9e41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_partitioned() -> bool:
+    partitioned = op.get_bind().execute(
+        sa.text(
+            "SELECT EXISTS (SELECT FROM pg_partitioned_table WHERE partrelid = 'vote'::regclass)"
+        )
+    )
+    return partitioned.scalar_one()
+
+
+def _rebuild(partition_by: str, partitions: int, primary_key: Sequence[str]) -> None:
+    op.execute("LOCK TABLE vote IN ACCESS EXCLUSIVE MODE")
+    op.execute(
+        "CREATE TABLE vote_rebuilt ("
+        " id uuid NOT NULL, idea_id uuid NOT NULL, user_id uuid NOT NULL, board_id uuid NOT NULL"
+        f"){partition_by}"
+    )
+
+    for remainder in range(partitions):
+        op.execute(
+            f"CREATE TABLE vote_p{remainder} PARTITION OF vote_rebuilt"
+            f" FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+
+    op.execute(
+        "INSERT INTO vote_rebuilt (id, idea_id, user_id, board_id)"
+        " SELECT id, idea_id, user_id, board_id FROM vote"
+    )
+    op.execute("DROP TABLE vote")
+    op.execute("ALTER TABLE vote_rebuilt RENAME TO vote")
+
+    # Constraints and indexes are declared on the parent and cascade to every partition
+    op.create_primary_key("vote_pkey", "vote", primary_key)
+    op.create_unique_constraint("uq_vote_board_user", "vote", ["board_id", "user_id"])
+    op.create_foreign_key(
+        "vote_idea_id_fkey", "vote", "idea", ["idea_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_foreign_key(
+        "vote_user_id_fkey", "vote", "user", ["user_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_foreign_key(
+        "vote_board_id_fkey", "vote", "board", ["board_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_index("ix_vote_user_id_id", "vote", ["user_id", "id"])
+    op.create_index("ix_vote_idea_id", "vote", ["idea_id"])
+    op.execute("ANALYZE vote")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if settings.vote_partitions < 2 or _is_partitioned():
+        return
+
+    _rebuild(" PARTITION BY HASH (board_id)", settings.vote_partitions, ["id", "board_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _is_partitioned():
+        return
+
+    _rebuild("", 0, ["id"])
@@ -0,0 +1,73 @@
+"""Add frozen result snapshots for closed boards
+
+Revision ID: 662aed5a5239
+Revises: 1a483c5d64cd
+Create Date: 2026-10-18 15:02:37.514420
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "662aed5a5239"
+down_revision: Union[str, Sequence[str], None] = "1a483c5d64cd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "board_snapshot",
+        sa.Column("board_id", sa.UUID(), nullable=False),
+        sa.Column("total_votes", sa.Integer(), nullable=False),
+        sa.Column("ideas", postgresql.JSONB(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["board.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("board_id"),
+    )
+
+    # Boards closed before this revision get their snapshot right away
+    op.execute(
+        """
+        INSERT INTO board_snapshot (board_id, total_votes, ideas)
+        SELECT
+            board.id,
+            coalesce(max(ranked.total_votes), 0),
+            coalesce(
+                jsonb_agg(
+                    jsonb_build_object(
+                        'id', ranked.id,
+                        'votes_count', ranked.votes_count,
+                        'percent_votes', (CASE WHEN ranked.total_votes > 0
+                            THEN ranked.votes_count * 100.0 / ranked.total_votes
+                            ELSE 0 END)::float8,
+                        'rank', ranked.rank,
+                        'is_winner', ranked.rank = 1 AND ranked.votes_count > 0
+                    )
+                    ORDER BY ranked.rank, ranked.id
+                ) FILTER (WHERE ranked.id IS NOT NULL),
+                '[]'::jsonb
+            )
+        FROM board
+        LEFT JOIN (
+            SELECT
+                idea.id,
+                idea.board_id,
+                idea.votes_count,
+                sum(idea.votes_count) OVER (PARTITION BY idea.board_id) AS total_votes,
+                rank() OVER (PARTITION BY idea.board_id ORDER BY idea.votes_count DESC) AS rank
+            FROM idea
+        ) AS ranked ON ranked.board_id = board.id
+        WHERE board.status = 'closed'
+        GROUP BY board.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("board_snapshot")
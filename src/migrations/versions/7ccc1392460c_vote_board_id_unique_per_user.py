@@ -0,0 +1,61 @@
+"""Store board_id on vote and enforce one vote per board
+
+Revision ID: 7ccc1392460c
+Revises: aa31a4aa98dc
+Create Date: 2026-10-18 14:20:11.482013
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.migrations.helpers import (
+    add_foreign_key_not_valid,
+    add_unique_constraint_concurrently,
+    batched_backfill,
+    set_not_null,
+    validate_constraint,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "7ccc1392460c"
+down_revision: Union[str, Sequence[str], None] = "aa31a4aa98dc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("vote", sa.Column("board_id", sa.UUID(), nullable=True))
+
+    batched_backfill(
+        "vote",
+        "board_id = (SELECT idea.board_id FROM idea WHERE idea.id = vote.idea_id)",
+        "board_id IS NULL",
+    )
+
+    # The old check-then-insert was racy, so duplicates may exist: keep one vote per pair.
+    # Committed on its own, so only the deleted rows are locked and only briefly
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DELETE FROM vote AS duplicate USING vote AS kept"
+            " WHERE duplicate.board_id = kept.board_id"
+            " AND duplicate.user_id = kept.user_id"
+            " AND duplicate.id > kept.id"
+        )
+
+    set_not_null("vote", "board_id")
+    add_foreign_key_not_valid(
+        "vote_board_id_fkey", "vote", "board", ["board_id"], ["id"], ondelete="CASCADE"
+    )
+    validate_constraint("vote", "vote_board_id_fkey")
+    add_unique_constraint_concurrently("uq_vote_board_user", "vote", ["board_id", "user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_vote_board_user", "vote", type_="unique")
+    op.drop_constraint("vote_board_id_fkey", "vote", type_="foreignkey")
+    op.drop_column("vote", "board_id")
@@ -0,0 +1,31 @@
+"""Add board version bumped on every change visible to readers
+
+Revision ID: 8b4f2e6d1c37
+Revises: 5d8e1b3c7a92
+Create Date: 2026-10-18 17:12:08.413590
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b4f2e6d1c37"
+down_revision: Union[str, Sequence[str], None] = "5d8e1b3c7a92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "board",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("board", "version")
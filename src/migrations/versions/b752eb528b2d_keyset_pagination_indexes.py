@@ -0,0 +1,29 @@
+"""Add indexes backing keyset pagination
+
+Revision ID: b752eb528b2d
+Revises: 662aed5a5239
+Create Date: 2026-10-18 15:31:08.220946
+
+"""
+
+from typing import Sequence, Union
+
+from src.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "b752eb528b2d"
+down_revision: Union[str, Sequence[str], None] = "662aed5a5239"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_concurrently("ix_idea_board_id_id", "idea", ["board_id", "id"])
+    create_index_concurrently("ix_vote_user_id_id", "vote", ["user_id", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently("ix_vote_user_id_id", "vote")
+    drop_index_concurrently("ix_idea_board_id_id", "idea")
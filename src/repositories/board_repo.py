@@ -1,10 +1,14 @@
 import uuid
+from typing import Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import String, cast, func, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.board_status import BoardStatus
+from src.domain import constants
 from src.domain.models.board import Board
+from src.domain.models.idea import Idea
 
 
 class BoardRepository:
@@ -22,12 +26,67 @@ class BoardRepository:
 
         return result.scalar_one_or_none()
 
-    async def get_all(self):
-        result = await self.session.execute(select(Board))
+    async def get_version(self, board_id: uuid.UUID):
+        # Board version plus a digest of its vote counters: votes change the
+        # tag without writing to the board row, which would serialize them
+        counters = (
+            select(
+                func.md5(
+                    func.coalesce(
+                        func.string_agg(
+                            cast(Idea.votes_count, String), aggregate_order_by(",", Idea.id)
+                        ),
+                        "",
+                    )
+                )
+            )
+            .where(Idea.board_id == Board.id)
+            .scalar_subquery()
+        )
+
+        result = await self.session.execute(
+            select(Board.version, counters.label("counters")).where(Board.id == board_id)
+        )
+
+        row = result.one_or_none()
+        return None if row is None else f"{row.version}-{row.counters[:16]}"
+
+    async def bump_version(self, board_id: uuid.UUID):
+        await self.session.execute(
+            update(Board)
+            .where(Board.id == board_id)
+            .values(version=Board.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_all(self, limit: int, after: Optional[uuid.UUID] = None):
+        query = select(Board).order_by(Board.id).limit(limit)
+
+        if after is not None:
+            query = query.where(Board.id > after)
+
+        result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def stream_all(self):
+        result = await self.session.stream(
+            select(Board.id, Board.title, Board.status)
+            .order_by(Board.id)
+            .execution_options(yield_per=constants.EXPORT_BATCH_SIZE)
+        )
+
+        async for batch in result.mappings().partitions():
+            yield batch
+
     async def update_status(self, board_id: uuid.UUID, status: BoardStatus):
-        await self.session.execute(update(Board).where(Board.id == board_id).values(status=status))
+        # Closed boards are final; None when the board is missing or already closed
+        result = await self.session.execute(
+            update(Board)
+            .where(Board.id == board_id)
+            .where(Board.status != BoardStatus.closed)
+            .values(status=status, version=Board.version + 1)
+            .returning(Board)
+            .execution_options(populate_existing=True)
+        )
 
-        await self.session.flush()
-        return await self.get(board_id)
+        return result.scalar_one_or_none()
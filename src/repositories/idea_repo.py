@@ -1,9 +1,15 @@
 import uuid
+from typing import Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import count
 
+from src.board_status import BoardStatus
+from src.domain import constants
+from src.domain.models.board import Board
 from src.domain.models.idea import Idea
+from src.domain.models.vote import Vote
 
 
 class IdeaRepository:
@@ -23,31 +29,103 @@ class IdeaRepository:
 
         return result.scalar_one_or_none()
 
-    async def get_all_from_one_board(self, board_id: uuid.UUID):
-        result = await self.session.execute(select(Idea).where(Idea.board_id == board_id))
+    async def get_all_from_one_board(
+        self, board_id: uuid.UUID, limit: int, after: Optional[uuid.UUID] = None
+    ):
+        query = select(Idea).where(Idea.board_id == board_id).order_by(Idea.id).limit(limit)
+
+        if after is not None:
+            query = query.where(Idea.id > after)
+
+        result = await self.session.execute(query)
 
         return result.scalars().all()
 
-    async def update_title(self, idea_id: uuid.UUID, title: str):
-        await self.session.execute(update(Idea).where(Idea.id == idea_id).values(title=title))
+    async def stream_from_one_board(self, board_id: uuid.UUID):
+        result = await self.session.stream(
+            select(Idea.id, Idea.title, Idea.description, Idea.board_id)
+            .where(Idea.board_id == board_id)
+            .order_by(Idea.id)
+            .execution_options(yield_per=constants.EXPORT_BATCH_SIZE)
+        )
 
-        await self.session.flush()
-        return await self.get(idea_id)
+        async for batch in result.mappings().partitions():
+            yield batch
+
+    @staticmethod
+    def _on_board_in_status(idea_id: uuid.UUID, board_status: Optional[BoardStatus]):
+        # Matches the idea only while its board is in the given status
+        conditions = [Idea.id == idea_id]
+
+        if board_status is not None:
+            conditions.append(
+                Idea.board_id.in_(select(Board.id).where(Board.status == board_status))
+            )
+
+        return conditions
+
+    async def update_title(
+        self, idea_id: uuid.UUID, title: str, board_status: Optional[BoardStatus] = None
+    ):
+        result = await self.session.execute(
+            update(Idea)
+            .where(*self._on_board_in_status(idea_id, board_status))
+            .values(title=title)
+            .returning(Idea)
+            .execution_options(populate_existing=True)
+        )
+
+        return result.scalar_one_or_none()
+
+    async def update_description(
+        self, idea_id: uuid.UUID, description: str, board_status: Optional[BoardStatus] = None
+    ):
+        result = await self.session.execute(
+            update(Idea)
+            .where(*self._on_board_in_status(idea_id, board_status))
+            .values(description=description)
+            .returning(Idea)
+            .execution_options(populate_existing=True)
+        )
 
-    async def update_description(self, idea_id: uuid.UUID, description: str):
+        return result.scalar_one_or_none()
+
+    async def reconcile_vote_counters(self, board_id: uuid.UUID):
+        # One board per call, so a full repair never holds more than one board.
+        # The board is locked first, which waits out the votes holding it
+        # share-locked, so no vote can commit between the count's snapshot and
+        # the counter update
         await self.session.execute(
-            update(Idea).where(Idea.id == idea_id).values(description=description)
+            select(Board.id).where(Board.id == board_id).with_for_update(key_share=True)
         )
 
-        await self.session.flush()
-        return await self.get(idea_id)
+        actual = (
+            select(count(Vote.id))
+            .where(Vote.board_id == board_id)
+            .where(Vote.idea_id == Idea.id)
+            .scalar_subquery()
+        )
 
-    async def delete(self, idea_id: uuid.UUID):
-        idea = await self.get(idea_id)
+        result = await self.session.execute(
+            update(Idea)
+            .where(Idea.board_id == board_id)
+            .where(Idea.votes_count != actual)
+            .values(votes_count=actual)
+            .returning(Idea.id)
+            .execution_options(synchronize_session=False)
+        )
 
-        if idea is None:
-            return False
+        # Ids of the ideas whose counters had drifted
+        return result.scalars().all()
 
+    async def delete(self, idea_id: uuid.UUID, board_status: Optional[BoardStatus] = None):
         # Hard del might rethink
-        await self.session.delete(idea)
-        return True
+        result = await self.session.execute(
+            delete(Idea)
+            .where(*self._on_board_in_status(idea_id, board_status))
+            .returning(Idea.board_id)
+            .execution_options(synchronize_session=False)
+        )
+
+        # Board of the removed idea, None when nothing matched
+        return result.scalar_one_or_none()
@@ -0,0 +1,26 @@
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models.snapshot import BoardSnapshot
+
+
+class SnapshotRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, board_id: uuid.UUID, total_votes: int, ideas: list[dict]):
+        snapshot = BoardSnapshot(board_id=board_id, total_votes=total_votes, ideas=ideas)
+
+        self.session.add(snapshot)
+        await self.session.flush()
+
+        return snapshot
+
+    async def get(self, board_id: uuid.UUID):
+        result = await self.session.execute(
+            select(BoardSnapshot).where(BoardSnapshot.board_id == board_id)
+        )
+
+        return result.scalar_one_or_none()
@@ -1,4 +1,5 @@
 import uuid
+from typing import Optional
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,23 +24,29 @@ class UserRepository:
 
         return result.scalar_one_or_none()
 
-    async def get_all(self):
-        result = await self.session.execute(select(User))
+    async def get_all(self, limit: int, after: Optional[uuid.UUID] = None):
+        query = select(User).order_by(User.id).limit(limit)
+
+        if after is not None:
+            query = query.where(User.id > after)
+
+        result = await self.session.execute(query)
         return result.scalars().all()
 
     async def update_name(self, user_id: uuid.UUID, name: str):
-        await self.session.execute(update(User).where(User.id == user_id).values(name=name))
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(name=name)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
 
-        await self.session.flush()
-        return await self.get(user_id)
+        return result.scalar_one_or_none()
 
     async def delete(self, user_id: uuid.UUID):
-        user = await self.get(user_id)
+        result = await self.session.execute(
+            update(User).where(User.id == user_id).values(is_deleted=True).returning(User.id)
+        )
 
-        if user is None:
-            return False
-
-        await self.session.execute(update(User).where(User.id == user_id).values(is_deleted=True))
-
-        await self.session.flush()
-        return True
+        return result.scalar_one_or_none() is not None
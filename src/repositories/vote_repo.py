@@ -1,11 +1,17 @@
 import uuid
+from typing import Optional
 
-from sqlalchemy import delete, select
+from sqlalchemy import Float, cast, delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import count
 
+from src.board_status import BoardStatus
+from src.domain import constants
 from src.domain.models.board import Board
 from src.domain.models.idea import Idea
+from src.domain.models.ids import uuid7
+from src.domain.models.user import User
 from src.domain.models.vote import Vote
 
 
@@ -13,69 +19,218 @@ class VoteRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, idea_id: uuid.UUID, user_id: uuid.UUID):
-        vote = Vote(idea_id=idea_id, user_id=user_id)
+    async def cast(self, idea_id: uuid.UUID, user_id: uuid.UUID):
+        # All checks and the insert run as one statement: vote_id stays NULL
+        # when a check fails or the (board_id, user_id) pair is already taken,
+        # board_id stays NULL when the idea doesn't exist. The board row is
+        # share-locked: votes don't wait on each other, but closing the board
+        # or reconciling its counters waits for the ones in flight.
+        user_exists = select(User.id).where(User.id == user_id).exists()
+
+        target = (
+            select(
+                Idea.id.label("idea_id"),
+                Board.id.label("board_id"),
+                Board.status.label("board_status"),
+            )
+            .join(Board, Board.id == Idea.board_id)
+            .where(Idea.id == idea_id)
+            .with_for_update(read=True, of=Board)
+            .cte("target")
+        )
 
-        self.session.add(vote)
-        await self.session.flush()
+        inserted = (
+            insert(Vote)
+            .from_select(
+                ["id", "idea_id", "user_id", "board_id"],
+                select(
+                    literal(uuid7(), Vote.id.type),
+                    target.c.idea_id,
+                    literal(user_id, Vote.user_id.type),
+                    target.c.board_id,
+                )
+                .where(user_exists)
+                .where(target.c.board_status == BoardStatus.published),
+            )
+            .on_conflict_do_nothing(constraint="uq_vote_board_user")
+            .returning(Vote.id, Vote.idea_id)
+            .cte("inserted")
+        )
 
-        return vote
+        counted = (
+            update(Idea)
+            .where(Idea.id.in_(select(inserted.c.idea_id)))
+            .values(votes_count=Idea.votes_count + 1)
+            .cte("counted")
+        )
+
+        result = await self.session.execute(
+            select(
+                user_exists.label("user_exists"),
+                select(target.c.board_id).scalar_subquery().label("board_id"),
+                select(target.c.board_status).scalar_subquery().label("board_status"),
+                select(inserted.c.id).scalar_subquery().label("vote_id"),
+            ).add_cte(counted)
+        )
+
+        return result.one()
 
     async def get(self, vote_id: uuid.UUID):
         result = await self.session.execute(select(Vote).where(Vote.id == vote_id))
 
         return result.scalar_one_or_none()
 
-    async def is_voted_already(self, user_id: uuid.UUID, board_id: uuid.UUID):
+    async def get_board_results(self, board_id: uuid.UUID):
+        # Outer join keeps zero-vote ideas and yields a single NULL idea row for an
+        # empty board, so no rows at all means the board doesn't exist
+        total_votes = func.sum(Idea.votes_count).over()
+        rank = func.rank().over(order_by=Idea.votes_count.desc())
+
         result = await self.session.execute(
-            select(Vote)
-            .join(Idea, Idea.id == Vote.idea_id)
-            .where(Idea.board_id == board_id)
-            .where(Vote.user_id == user_id)
+            select(
+                Idea.id.label("idea_id"),
+                Idea.votes_count.label("votes_count"),
+                func.coalesce(total_votes, 0).label("total_votes"),
+                func.coalesce(
+                    cast(Idea.votes_count, Float) * 100 / func.nullif(total_votes, 0), 0.0
+                ).label("percent_votes"),
+                rank.label("rank"),
+                ((rank == 1) & (Idea.votes_count > 0)).label("is_winner"),
+            )
+            .select_from(Board)
+            .outerjoin(Idea, Idea.board_id == Board.id)
+            .where(Board.id == board_id)
+            .order_by(rank, Idea.id)
         )
 
-        return result.scalar_one_or_none() is not None
+        return result.all()
 
-    async def get_ideas_vote_count(self, board_id: uuid.UUID):
+    async def count_board_votes(self, board_id: uuid.UUID):
+        # Sums the denormalized counters instead of scanning the votes themselves
         result = await self.session.execute(
-            select(Idea.id.label("id"), count(Idea.id).label("votes_count"))
-            .join(Vote, Idea.id == Vote.idea_id)
-            .where(Idea.board_id == board_id)
-            .group_by(Idea.id)
+            select(func.coalesce(func.sum(Idea.votes_count), 0)).where(Idea.board_id == board_id)
         )
 
-        return result.mappings().all()
+        return result.scalar_one()
 
-    async def get_board_votes(self, board_id: uuid.UUID):
-        result = await self.session.execute(
-            select(Vote.id).join(Idea, Idea.id == Vote.idea_id).where(Idea.board_id == board_id)
+    async def stream_board_votes(self, board_id: uuid.UUID):
+        result = await self.session.stream(
+            select(Vote.id, Vote.idea_id, Vote.user_id)
+            .where(Vote.board_id == board_id)
+            .order_by(Vote.id)
+            .execution_options(yield_per=constants.EXPORT_BATCH_SIZE)
         )
 
-        return result.scalars().all()
+        async for batch in result.mappings().partitions():
+            yield batch
 
-    async def get_user_votes(self, user_id: uuid.UUID):
-        result = await self.session.execute(
-            select(Vote, Idea.title, Board.id)
-            .select_from(Vote)
+    async def get_user_votes(
+        self, user_id: uuid.UUID, limit: int, after: Optional[uuid.UUID] = None
+    ):
+        query = (
+            select(Vote, Idea.title, Vote.board_id)
             .join(Idea, Idea.id == Vote.idea_id)
-            .join(Board, Board.id == Idea.board_id)
             .where(Vote.user_id == user_id)
+            .order_by(Vote.id)
+            .limit(limit)
         )
 
+        if after is not None:
+            query = query.where(Vote.id > after)
+
+        result = await self.session.execute(query)
+
         return result.all()
 
-    async def vote_mass_delete(self, id_group: list[uuid.UUID]):
-        await self.session.execute(delete(Vote).where(Vote.id.in_(id_group)))
+    async def delete_board_votes(
+        self,
+        board_id: uuid.UUID,
+        limit: Optional[int] = None,
+        board_status: Optional[BoardStatus] = None,
+    ):
+        # Mirrors revoke: counters change in the same statement as the deletes,
+        # so every committed chunk leaves them consistent. Nothing is removed
+        # unless the board is in board_status
+        target = (
+            select(Board.id).where(Board.id == board_id).with_for_update(key_share=True, of=Board)
+        )
+        if board_status is not None:
+            target = target.where(Board.status == board_status)
+        target = target.cte("target")
+
+        # board_id on the delete itself, so a partitioned vote table is pruned
+        query = (
+            delete(Vote)
+            .where(Vote.board_id == board_id)
+            .where(Vote.board_id.in_(select(target.c.id)))
+        )
+
+        if limit is not None:
+            chunk = select(Vote.id).where(Vote.board_id == board_id).limit(limit)
+            query = query.where(Vote.id.in_(chunk.scalar_subquery()))
+
+        removed = query.returning(Vote.idea_id).cte("removed")
+
+        per_idea = (
+            select(removed.c.idea_id, count().label("removed"))
+            .group_by(removed.c.idea_id)
+            .subquery("per_idea")
+        )
+
+        uncounted = (
+            update(Idea)
+            .where(Idea.id == per_idea.c.idea_id)
+            .values(votes_count=Idea.votes_count - per_idea.c.removed)
+            .cte("uncounted")
+        )
 
-        await self.session.flush()
+        result = await self.session.execute(
+            select(select(count()).select_from(removed).scalar_subquery()).add_cte(uncounted)
+        )
+
+        return result.scalar_one()
+
+    async def revoke(self, vote_id: uuid.UUID):
+        # Mirrors cast: the vote is removed only while its board is published,
+        # board_id stays NULL when the vote doesn't exist
+        target = (
+            select(
+                Vote.id.label("vote_id"),
+                Board.id.label("board_id"),
+                Board.status.label("board_status"),
+            )
+            .join(Board, Board.id == Vote.board_id)
+            .where(Vote.id == vote_id)
+            .with_for_update(read=True, of=Board)
+            .cte("target")
+        )
 
-    async def delete(self, vote_id: uuid.UUID):
-        vote = await self.get(vote_id)
+        removed = (
+            delete(Vote)
+            .where(
+                Vote.id.in_(
+                    select(target.c.vote_id).where(target.c.board_status == BoardStatus.published)
+                )
+            )
+            # Known once target ran, so a partitioned vote table is pruned at execution
+            .where(Vote.board_id == select(target.c.board_id).scalar_subquery())
+            .returning(Vote.idea_id)
+            .cte("removed")
+        )
 
-        if vote is None:
-            return False
+        uncounted = (
+            update(Idea)
+            .where(Idea.id.in_(select(removed.c.idea_id)))
+            .values(votes_count=Idea.votes_count - 1)
+            .cte("uncounted")
+        )
 
-        await self.session.delete(vote)
-        await self.session.flush()
+        result = await self.session.execute(
+            select(
+                select(target.c.board_id).scalar_subquery().label("board_id"),
+                select(target.c.board_status).scalar_subquery().label("board_status"),
+                select(count()).select_from(removed).scalar_subquery().label("removed"),
+            ).add_cte(uncounted)
+        )
 
-        return True
+        return result.one()
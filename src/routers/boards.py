@@ -1,23 +1,31 @@
 import uuid
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request, Response
 from fastapi.params import Depends
 
 from src.adapters.db_work_unit import DBWorkUnit
-from src.app.di_frame import get_uow
+from src.app.di_frame import get_uow, rate_limited
+from src.domain import constants
 from src.domain.schemas.board import BoardCreate, BoardOut, BoardStatusUpdate
-from src.domain.schemas.stats import Percentages, Votes, Winners
+from src.domain.schemas.page import Page
+from src.domain.schemas.stats import BoardResults, Percentages, Votes, Winners
+from src.routers.conditional import NOT_MODIFIED_RESPONSES, not_modified
+from src.routers.streaming import NDJSON_MEDIA_TYPE, ndjson_response
 from src.services.board_service import BoardMaintainService
 from src.services.statistic_service import StatisticService
 
-router = APIRouter(prefix="/boards", tags=["boards"])
+router = APIRouter(prefix="/boards", tags=["boards"], dependencies=[rate_limited()])
 service = BoardMaintainService()
 stat_service = StatisticService()
 
 
-def get_limiter(request: Request):
-    return request.app.state.limiter
+FINAL_RESULTS_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def apply_results_cache_policy(response: Response, results: BoardResults):
+    if results.final:
+        response.headers["Cache-Control"] = FINAL_RESULTS_CACHE_CONTROL
 
 
 @router.post("/", response_model=BoardCreate, status_code=201)
@@ -25,13 +33,35 @@ async def create_board(board: BoardCreate, uow: DBWorkUnit = Depends(get_uow)):
     return await service.create_board(uow, board)
 
 
-@router.get("/all", response_model=List[BoardOut], status_code=200)
-async def get_all_boards(uow: DBWorkUnit = Depends(get_uow)):
-    return await service.get_board_list(uow)
+@router.get("/all", response_model=Page[BoardOut], status_code=200)
+async def get_all_boards(
+    limit: int = Query(constants.PAGE_DEFAULT_LIMIT, ge=1, le=constants.PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    uow: DBWorkUnit = Depends(get_uow),
+):
+    return await service.get_board_list(uow, limit, cursor)
+
+
+@router.get(
+    "/export",
+    response_model=None,
+    status_code=200,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_boards(uow: DBWorkUnit = Depends(get_uow)):
+    return ndjson_response(service.export_boards(uow), BoardOut)
 
 
-@router.get("/{board_id}", response_model=BoardOut, status_code=200)
-async def get_board(board_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
+@router.get(
+    "/{board_id}", response_model=BoardOut, status_code=200, responses=NOT_MODIFIED_RESPONSES
+)
+async def get_board(
+    board_id: uuid.UUID, request: Request, response: Response, uow: DBWorkUnit = Depends(get_uow)
+):
+    unchanged = await not_modified(request, response, uow, board_id)
+    if unchanged is not None:
+        return unchanged
+
     return await service.get_board(uow, board_id)
 
 
@@ -42,16 +72,77 @@ async def update_board(
     return await service.change_board_status(uow, board_id, data)
 
 
-@router.get("/{board_id}/votes", response_model=List[Votes], status_code=200)
-async def get_board_votes(board_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
-    return await stat_service.get_voting_stats(uow, board_id)
+@router.get(
+    "/{board_id}/votes",
+    response_model=List[Votes],
+    status_code=200,
+    responses=NOT_MODIFIED_RESPONSES,
+)
+async def get_board_votes(
+    board_id: uuid.UUID, request: Request, response: Response, uow: DBWorkUnit = Depends(get_uow)
+):
+    unchanged = await not_modified(request, response, uow, board_id)
+    if unchanged is not None:
+        return unchanged
+
+    results = await stat_service.get_board_results(uow, board_id)
+    apply_results_cache_policy(response, results)
 
+    return stat_service.to_votes(results)
 
-@router.get("/{board_id}/percentage", response_model=List[Percentages], status_code=200)
-async def get_board_percentage(board_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
-    return await stat_service.get_voting_percentage(uow, board_id)
 
+@router.get(
+    "/{board_id}/percentage",
+    response_model=List[Percentages],
+    status_code=200,
+    responses=NOT_MODIFIED_RESPONSES,
+)
+async def get_board_percentage(
+    board_id: uuid.UUID, request: Request, response: Response, uow: DBWorkUnit = Depends(get_uow)
+):
+    unchanged = await not_modified(request, response, uow, board_id)
+    if unchanged is not None:
+        return unchanged
+
+    results = await stat_service.get_board_results(uow, board_id)
+    apply_results_cache_policy(response, results)
+
+    return stat_service.to_percentages(results)
+
+
+@router.get(
+    "/{board_id}/winners",
+    response_model=Winners,
+    status_code=200,
+    responses=NOT_MODIFIED_RESPONSES,
+)
+async def get_board_winners(
+    board_id: uuid.UUID, request: Request, response: Response, uow: DBWorkUnit = Depends(get_uow)
+):
+    unchanged = await not_modified(request, response, uow, board_id)
+    if unchanged is not None:
+        return unchanged
+
+    results = await stat_service.get_board_results(uow, board_id)
+    apply_results_cache_policy(response, results)
+
+    return stat_service.to_winners(results)
+
+
+@router.get(
+    "/{board_id}/results",
+    response_model=BoardResults,
+    status_code=200,
+    responses=NOT_MODIFIED_RESPONSES,
+)
+async def get_board_results(
+    board_id: uuid.UUID, request: Request, response: Response, uow: DBWorkUnit = Depends(get_uow)
+):
+    unchanged = await not_modified(request, response, uow, board_id)
+    if unchanged is not None:
+        return unchanged
+
+    results = await stat_service.get_board_results(uow, board_id)
+    apply_results_cache_policy(response, results)
 
-@router.get("/{board_id}/winners", response_model=Winners, status_code=200)
-async def get_board_winners(board_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
-    return await stat_service.get_winner(uow, board_id)
+    return results
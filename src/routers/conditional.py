@@ -0,0 +1,42 @@
+import uuid
+from typing import Optional
+
+from fastapi import Request, Response
+
+from src.adapters.db_work_unit import DBWorkUnit
+from src.services.board_service import BoardMaintainService
+
+NOT_MODIFIED_RESPONSES = {304: {"description": "Board unchanged since the ETag in If-None-Match"}}
+
+service = BoardMaintainService()
+
+
+def board_etag(board_id: uuid.UUID, version: str) -> str:
+    return f'"{board_id.hex}-{version}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+async def not_modified(
+    request: Request, response: Response, uow: DBWorkUnit, board_id: uuid.UUID
+) -> Optional[Response]:
+    # Tags the response with the board version. When the client already has it,
+    # returns a bare 304 before any ORM load or serialization; with the version
+    # cached, before any database access too
+    version = await service.get_board_version(uow, board_id)
+    if version is None:
+        return None
+
+    etag = board_etag(board_id, version)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return None
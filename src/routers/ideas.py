@@ -1,30 +1,51 @@
 import uuid
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query, Request, Response
 from fastapi.params import Depends
 
 from src.adapters.db_work_unit import DBWorkUnit
-from src.app.di_frame import get_uow
+from src.app.di_frame import get_uow, rate_limited
+from src.domain import constants
 from src.domain.schemas.idea import IdeaCreate, IdeaOut, IdeaUpdateDescription, IdeaUpdateTitle
+from src.domain.schemas.page import Page
+from src.routers.conditional import NOT_MODIFIED_RESPONSES, not_modified
+from src.routers.streaming import NDJSON_MEDIA_TYPE, ndjson_response
 from src.services.idea_service import IdeaMaintainService
 
-router = APIRouter(prefix="/ideas", tags=["ideas"])
+router = APIRouter(prefix="/ideas", tags=["ideas"], dependencies=[rate_limited()])
 service = IdeaMaintainService()
 
 
-def get_limiter(request: Request):
-    return request.app.state.limiter
-
-
 @router.post("/", response_model=IdeaCreate, status_code=201)
 async def create_idea(idea: IdeaCreate, uow: DBWorkUnit = Depends(get_uow)):
     return await service.create_idea(uow, idea)
 
 
-@router.get("/all", response_model=List[IdeaOut], status_code=200)
-async def get_all_board_ideas(board_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
-    return await service.get_all_board_ideas(uow, board_id)
+@router.get("/all", response_model=Page[IdeaOut], status_code=200, responses=NOT_MODIFIED_RESPONSES)
+async def get_all_board_ideas(
+    board_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(constants.PAGE_DEFAULT_LIMIT, ge=1, le=constants.PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    uow: DBWorkUnit = Depends(get_uow),
+):
+    unchanged = await not_modified(request, response, uow, board_id)
+    if unchanged is not None:
+        return unchanged
+
+    return await service.get_all_board_ideas(uow, board_id, limit, cursor)
+
+
+@router.get(
+    "/export",
+    response_model=None,
+    status_code=200,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_board_ideas(board_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
+    return ndjson_response(await service.export_board_ideas(uow, board_id), IdeaOut)
 
 
 @router.get("/{idea_id}", response_model=IdeaOut, status_code=200)
@@ -0,0 +1,67 @@
+from secrets import compare_digest
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header
+
+from src.adapters.circuit_breaker import breaker_for
+from src.adapters.stats_cache import stats_cache
+from src.app.di_frame import rate_limited
+from src.app.storage_setup import (
+    async_session_factory,
+    engine,
+    replica_engines,
+    replica_session_factories,
+)
+from src.config import settings
+from src.domain.schemas.metrics import (
+    DatabaseCircuitBreakerMetrics,
+    DatabasePoolMetrics,
+    StatsCacheMetrics,
+    TimeoutMetrics,
+)
+from src.exceptions.base import NotFoundException, Unauthorized
+from src.middleware.ratelimits import timeout_counts
+
+
+def require_metrics_access(authorization: Optional[str] = Header(None)):
+    # Internals of the deployment, kept off the public API unless asked for
+    if not settings.metrics_enabled:
+        raise NotFoundException()
+
+    if settings.metrics_token:
+        expected = f"Bearer {settings.metrics_token}".encode()
+        if not compare_digest((authorization or "").encode(), expected):
+            raise Unauthorized()
+
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+    dependencies=[rate_limited(), Depends(require_metrics_access)],
+)
+
+
+@router.get("/stats_cache", response_model=StatsCacheMetrics, status_code=200)
+async def get_stats_cache_metrics():
+    return stats_cache.stats()
+
+
+@router.get("/pool", response_model=DatabasePoolMetrics, status_code=200)
+async def get_pool_metrics():
+    return {
+        "primary": engine.pool.stats(),
+        "replicas": [replica.pool.stats() for replica in replica_engines],
+    }
+
+
+@router.get("/timeouts", response_model=TimeoutMetrics, status_code=200)
+async def get_timeout_metrics():
+    return {"total": sum(timeout_counts.values()), "routes": dict(timeout_counts)}
+
+
+@router.get("/circuit_breaker", response_model=DatabaseCircuitBreakerMetrics, status_code=200)
+async def get_circuit_breaker_metrics():
+    return {
+        "primary": breaker_for(async_session_factory).stats(),
+        "replicas": [breaker_for(factory).stats() for factory in replica_session_factories],
+    }
@@ -0,0 +1,16 @@
+from typing import AsyncIterator, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_chunks(batches: AsyncIterator, schema: Type[BaseModel]):
+    # One chunk per server-side cursor batch, so memory stays flat for any export size
+    async for batch in batches:
+        yield "".join(schema.model_validate(row).model_dump_json() + "\n" for row in batch)
+
+
+def ndjson_response(batches: AsyncIterator, schema: Type[BaseModel]) -> StreamingResponse:
+    return StreamingResponse(_ndjson_chunks(batches, schema), media_type=NDJSON_MEDIA_TYPE)
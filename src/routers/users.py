@@ -1,22 +1,20 @@
 import uuid
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Query
 from fastapi.params import Depends
 
 from src.adapters.db_work_unit import DBWorkUnit
-from src.app.di_frame import get_uow
+from src.app.di_frame import get_uow, rate_limited
+from src.domain import constants
+from src.domain.schemas.page import Page
 from src.domain.schemas.user import UserCreate, UserOut, UserUpdateName, UserVoteStatistic
 from src.services.user_service import UserMaintainService
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], dependencies=[rate_limited()])
 service = UserMaintainService()
 
 
-def get_limiter(request: Request):
-    return request.app.state.limiter
-
-
 @router.post("/", response_model=UserCreate, status_code=201)
 async def create_user(user: UserCreate, uow: DBWorkUnit = Depends(get_uow)):
     return await service.create_user(uow, user)
@@ -39,6 +37,11 @@ async def delete_user(user_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
     return await service.delete_user(uow, user_id)
 
 
-@router.get("/{user_id}/vote_history", response_model=List[UserVoteStatistic], status_code=200)
-async def get_user_vote_history(user_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
-    return await service.get_votes_history(uow, user_id)
+@router.get("/{user_id}/vote_history", response_model=Page[UserVoteStatistic], status_code=200)
+async def get_user_vote_history(
+    user_id: uuid.UUID,
+    limit: int = Query(constants.PAGE_DEFAULT_LIMIT, ge=1, le=constants.PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    uow: DBWorkUnit = Depends(get_uow),
+):
+    return await service.get_votes_history(uow, user_id, limit, cursor)
@@ -1,26 +1,38 @@
 import uuid
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter
 from fastapi.params import Depends
 
 from src.adapters.db_work_unit import DBWorkUnit
-from src.app.di_frame import get_uow
-from src.domain.schemas.vote import VoteCreate
+from src.app.di_frame import get_uow, rate_limited
+from src.config import settings
+from src.domain.schemas.vote import VoteCreate, VoteOut
+from src.routers.streaming import NDJSON_MEDIA_TYPE, ndjson_response
 from src.services.vote_service import VoteMaintainService
 
-router = APIRouter(prefix="/votes", tags=["votes"])
+router = APIRouter(
+    prefix="/votes",
+    tags=["votes"],
+    dependencies=[rate_limited(write_cost=settings.rate_limit_vote_cost)],
+)
 service = VoteMaintainService()
 
 
-def get_limiter(request: Request):
-    return request.app.state.limiter
-
-
 @router.post("/", response_model=VoteCreate, status_code=201)
 async def create_vote(vote: VoteCreate, uow: DBWorkUnit = Depends(get_uow)):
     return await service.create_vote(uow, vote)
 
 
+@router.get(
+    "/export",
+    response_model=None,
+    status_code=200,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def export_board_votes(board_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
+    return ndjson_response(await service.export_board_votes(uow, board_id), VoteOut)
+
+
 @router.delete("/{vote_id}/revoke", status_code=204)
 async def delete_vote(vote_id: uuid.UUID, uow: DBWorkUnit = Depends(get_uow)):
     return await service.delete_vote(uow, vote_id)
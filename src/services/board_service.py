@@ -1,16 +1,30 @@
 import uuid
+from functools import partial
+from typing import Optional
 
 from src.adapters.db_work_unit import DBWorkUnit
 from src.adapters.logger import logger
+from src.adapters.stats_cache import StatsCache, stats_cache
 from src.board_status import BoardStatus
+from src.config import settings
 from src.domain.models.board import Board
 from src.domain.models.vote import Vote
 from src.domain.schemas.board import BoardCreate, BoardStatusUpdate
+from src.domain.schemas.page import build_page, decode_cursor
 from src.exceptions.base import NotFoundException
 from src.exceptions.board import InvalidBoardStatus
+from src.services.statistic_service import StatisticService
 
 
 class BoardMaintainService:
+    def __init__(
+        self,
+        stat_service: Optional[StatisticService] = None,
+        cache: Optional[StatsCache] = None,
+    ):
+        self.cache = stats_cache if cache is None else cache
+        self.stat_service = stat_service or StatisticService(self.cache)
+
     async def create_board(self, uow: DBWorkUnit, data: BoardCreate):
         async with uow:
             board = Board(**data.model_dump())
@@ -32,37 +46,111 @@ class BoardMaintainService:
 
             return board
 
-    async def get_board_list(self, uow: DBWorkUnit):
+    async def get_board_version(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        # None when the board doesn't exist
+        version = None if uow.pinned_to_primary else self.cache.get_version(board_id)
+        if version is not None:
+            return version
+
+        generation = self.cache.generation(board_id)
+
+        async with uow:
+            version = await uow.repositories[Board].get_version(board_id)
+
+        if version is not None:
+            self.cache.set_version(board_id, version, generation)
+        return version
+
+    async def get_board_list(self, uow: DBWorkUnit, limit: int, cursor: Optional[str] = None):
+        after = decode_cursor(cursor)
+
         async with uow:
-            board_list = await uow.repositories[Board].get_all()
-            return board_list
+            board_list = await uow.repositories[Board].get_all(limit + 1, after)
+            return build_page(board_list, limit)
+
+    async def export_boards(self, uow: DBWorkUnit):
+        async with uow:
+            async for batch in uow.repositories[Board].stream_all():
+                yield batch
 
     async def change_board_status(
         self, uow: DBWorkUnit, board_id: uuid.UUID, data: BoardStatusUpdate
     ):
         async with uow:
-            board = await self.get_board(uow, board_id)
+            # Checked and applied in one statement, so concurrent changes can't
+            # both pass a check and one of them overwrite a close
+            updated_board = await uow.repositories[Board].update_status(
+                board_id, **data.model_dump()
+            )
 
-            if board.status == BoardStatus.closed:
-                raise InvalidBoardStatus(
-                    current_state=board.status,
-                    related_state=data.status.value,
-                    board_id=board_id,
-                    operation="changing status of board",
-                )
+            if updated_board is None:
+                await self._explain_rejected_status_change(uow, board_id, data)
+
+            uow.on_commit(partial(self.cache.invalidate, board_id))
 
-            # Cleaning all votes before mark board as draft
+            # Cleaning all votes when board goes back to draft
+            removed_votes = 0
             if data.status == BoardStatus.draft:
-                board_votes = await uow.repositories[Vote].get_board_votes(board_id)
-                await uow.repositories[Vote].vote_mass_delete(board_votes)
+                removed_votes = await self._purge_votes(uow, board_id)
 
             logger.info(
                 "Board status changed and linked votes erased",
                 extra={
                     "board_id": str(board_id),
-                    "old_status": board.status.value,
                     "new_status": data.status.value,
+                    "removed_votes": removed_votes,
                 },
             )
 
-            return await uow.repositories[Board].update_status(board_id, **data.model_dump())
+            # Closed boards never change again, so their results are frozen once
+            if data.status == BoardStatus.closed:
+                await self.stat_service.freeze_results(uow, board_id)
+
+            return updated_board
+
+    async def _explain_rejected_status_change(
+        self, uow: DBWorkUnit, board_id: uuid.UUID, data: BoardStatusUpdate
+    ):
+        # Only reached when the conditional update matched nothing
+        async with uow:
+            board = await self.get_board(uow, board_id)
+
+            raise InvalidBoardStatus(
+                current_state=board.status,
+                related_state=data.status.value,
+                board_id=board_id,
+                operation="changing status of board",
+            )
+
+    async def _purge_votes(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        async with uow:
+            expected = await uow.repositories[Vote].count_board_votes(board_id)
+
+            if expected <= settings.vote_purge_chunk_threshold:
+                removed = await uow.repositories[Vote].delete_board_votes(
+                    board_id, board_status=BoardStatus.draft
+                )
+                uow.on_commit(partial(self.cache.invalidate, board_id))
+            else:
+                removed = await self._purge_votes_in_chunks(uow, board_id)
+
+            return removed
+
+    async def _purge_votes_in_chunks(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        # The draft status is committed first so no new votes land meanwhile,
+        # then every chunk is its own short transaction. Chunks only delete while
+        # the board is still a draft, so a concurrent re-publish stops the purge
+        # instead of losing fresh votes
+        await uow.commit()
+
+        removed = 0
+        while True:
+            chunk = await uow.repositories[Vote].delete_board_votes(
+                board_id, settings.vote_purge_chunk_size, BoardStatus.draft
+            )
+            uow.on_commit(partial(self.cache.invalidate, board_id))
+            await uow.commit()
+
+            removed += chunk
+            if chunk < settings.vote_purge_chunk_size:
+                return removed
@@ -1,16 +1,23 @@
 import uuid
+from functools import partial
+from typing import Optional
 
 from src.adapters.db_work_unit import DBWorkUnit
 from src.adapters.logger import logger
+from src.adapters.stats_cache import StatsCache, stats_cache
 from src.board_status import BoardStatus
 from src.domain.models.board import Board
 from src.domain.models.idea import Idea
 from src.domain.schemas.idea import IdeaCreate, IdeaUpdateDescription, IdeaUpdateTitle
+from src.domain.schemas.page import build_page, decode_cursor
 from src.exceptions.base import NotFoundException
 from src.exceptions.board import InvalidBoardStatus
 
 
 class IdeaMaintainService:
+    def __init__(self, cache: Optional[StatsCache] = None):
+        self.cache = stats_cache if cache is None else cache
+
     async def create_idea(self, uow: DBWorkUnit, data: IdeaCreate):
         async with uow:
             board = await uow.repositories[Board].get(data.board_id)
@@ -21,6 +28,8 @@ class IdeaMaintainService:
             await self._check_board_compatibility(uow, board.id)
 
             new_idea = await uow.repositories[Idea].create(**data.model_dump())
+            await uow.repositories[Board].bump_version(board.id)
+            uow.on_commit(partial(self.cache.invalidate, board.id))
 
             logger.info(
                 "New idea was successfully created",
@@ -38,12 +47,30 @@ class IdeaMaintainService:
 
             return result
 
-    async def get_all_board_ideas(self, uow: DBWorkUnit, board_id: uuid.UUID):
+    async def get_all_board_ideas(
+        self, uow: DBWorkUnit, board_id: uuid.UUID, limit: int, cursor: Optional[str] = None
+    ):
+        after = decode_cursor(cursor)
+
+        async with uow:
+            if await uow.repositories[Board].get(board_id) is None:
+                raise NotFoundException(Board)
+
+            ideas = await uow.repositories[Idea].get_all_from_one_board(board_id, limit + 1, after)
+            return build_page(ideas, limit)
+
+    async def export_board_ideas(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        # Checked before streaming starts: once the body is sent, errors can't become a 404
         async with uow:
             if await uow.repositories[Board].get(board_id) is None:
                 raise NotFoundException(Board)
 
-            return await uow.repositories[Idea].get_all_from_one_board(board_id)
+        return self._stream_board_ideas(uow, board_id)
+
+    async def _stream_board_ideas(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        async with uow:
+            async for batch in uow.repositories[Idea].stream_from_one_board(board_id):
+                yield batch
 
     async def _check_board_compatibility(self, uow: DBWorkUnit, board_id: uuid.UUID):
         async with uow:
@@ -56,44 +83,67 @@ class IdeaMaintainService:
                     board_id=board_id,
                 )
 
-    async def change_title(self, uow: DBWorkUnit, idea_id: uuid.UUID, data: IdeaUpdateTitle):
+    async def _explain_rejected_change(self, uow: DBWorkUnit, idea_id: uuid.UUID):
+        # Only reached when a conditional write matched nothing
         async with uow:
             idea = await self.get_idea(uow, idea_id)
             await self._check_board_compatibility(uow, idea.board_id)
 
+            # Both checks pass now, so the idea or its board changed concurrently
+            raise NotFoundException(Idea)
+
+    async def change_title(self, uow: DBWorkUnit, idea_id: uuid.UUID, data: IdeaUpdateTitle):
+        async with uow:
+            idea = await uow.repositories[Idea].update_title(
+                idea_id, **data.model_dump(), board_status=BoardStatus.draft
+            )
+
+            if idea is None:
+                await self._explain_rejected_change(uow, idea_id)
+
+            await uow.repositories[Board].bump_version(idea.board_id)
+            uow.on_commit(partial(self.cache.invalidate, idea.board_id))
+
             logger.info(
                 "Idea title changed successfully",
-                extra={"idea_id": str(idea_id), "old_title": idea.title, "new_title": data.title},
+                extra={"idea_id": str(idea_id), "new_title": data.title},
             )
 
-            return await uow.repositories[Idea].update_title(idea_id, **data.model_dump())
+            return idea
 
     async def change_description(
         self, uow: DBWorkUnit, idea_id: uuid.UUID, data: IdeaUpdateDescription
     ):
         async with uow:
-            idea = await self.get_idea(uow, idea_id)
-            await self._check_board_compatibility(uow, idea.board_id)
+            idea = await uow.repositories[Idea].update_description(
+                idea_id, **data.model_dump(), board_status=BoardStatus.draft
+            )
+
+            if idea is None:
+                await self._explain_rejected_change(uow, idea_id)
+
+            await uow.repositories[Board].bump_version(idea.board_id)
+            uow.on_commit(partial(self.cache.invalidate, idea.board_id))
 
             logger.info(
                 "Idea description changed successfully",
-                extra={
-                    "idea_id": str(idea_id),
-                    "old_desc": idea.description,
-                    "new_desc": data.description,
-                },
+                extra={"idea_id": str(idea_id), "new_desc": data.description},
             )
 
-            return await uow.repositories[Idea].update_description(idea_id, **data.model_dump())
+            return idea
 
     async def delete_idea(self, uow: DBWorkUnit, idea_id: uuid.UUID):
         async with uow:
-            idea = await self.get_idea(uow, idea_id)
-            await self._check_board_compatibility(uow, idea.board_id)
+            board_id = await uow.repositories[Idea].delete(idea_id, board_status=BoardStatus.draft)
+
+            if board_id is None:
+                await self._explain_rejected_change(uow, idea_id)
+
+            await uow.repositories[Board].bump_version(board_id)
 
             logger.info(
                 "Idea deleted successfully",
-                extra={"idea_id": str(idea_id), "board_id": str(idea.board_id)},
+                extra={"idea_id": str(idea_id), "board_id": str(board_id)},
             )
 
-            await uow.repositories[Idea].delete(idea_id)
+            uow.on_commit(partial(self.cache.invalidate, board_id))
@@ -1,46 +1,98 @@
 import uuid
+from typing import Optional
 
 from src.adapters.db_work_unit import DBWorkUnit
+from src.adapters.stats_cache import StatsCache, stats_cache
 from src.domain.models.board import Board
+from src.domain.models.snapshot import BoardSnapshot
 from src.domain.models.vote import Vote
-from src.domain.schemas.stats import Percentages, Winners
+from src.domain.schemas.stats import BoardResults, IdeaResult, Percentages, Votes, Winners
 from src.exceptions.base import NotFoundException
 
 
 class StatisticService:
-    async def get_voting_stats(self, uow: DBWorkUnit, board_id: uuid.UUID):
+    def __init__(self, cache: Optional[StatsCache] = None):
+        self.cache = stats_cache if cache is None else cache
+
+    async def get_board_results(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        cached = None if uow.pinned_to_primary else self.cache.get(board_id)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation(board_id)
+
         async with uow:
-            board = await uow.repositories[Board].get(board_id)
+            snapshot = await uow.repositories[BoardSnapshot].get(board_id)
 
-            if board is None:
-                raise NotFoundException(Board)
+            if snapshot is not None:
+                results = BoardResults(
+                    board_id=board_id,
+                    total_votes=snapshot.total_votes,
+                    ideas=snapshot.ideas,
+                    final=True,
+                )
+            else:
+                results = await self._collect_results(uow, board_id)
 
-            result = await uow.repositories[Vote].get_ideas_vote_count(board_id)
+        self.cache.set(board_id, results, generation)
+        return results
 
-            return result
+    async def freeze_results(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        async with uow:
+            results = await self._collect_results(uow, board_id)
 
-    async def get_voting_percentage(self, uow: DBWorkUnit, board_id: uuid.UUID):
+            await uow.repositories[BoardSnapshot].create(
+                board_id,
+                results.total_votes,
+                [idea.model_dump(mode="json") for idea in results.ideas],
+            )
+
+            return results.model_copy(update={"final": True})
+
+    async def _collect_results(self, uow: DBWorkUnit, board_id: uuid.UUID):
         async with uow:
-            counts = await self.get_voting_stats(uow, board_id)
+            rows = await uow.repositories[Vote].get_board_results(board_id)
 
-            all_votes = sum(vote.votes_count for vote in counts)
+            if len(rows) == 0:
+                raise NotFoundException(Board)
 
-            if all_votes == 0:
-                return []
+            return BoardResults(
+                board_id=board_id,
+                total_votes=rows[0].total_votes,
+                ideas=[
+                    IdeaResult(
+                        id=row.idea_id,
+                        votes_count=row.votes_count,
+                        percent_votes=row.percent_votes,
+                        rank=row.rank,
+                        is_winner=row.is_winner,
+                    )
+                    for row in rows
+                    if row.idea_id is not None
+                ],
+            )
 
-            return [
-                Percentages(id=vote.id, percent_votes=100.0 * vote.votes_count / all_votes)
-                for vote in counts
-            ]
+    @staticmethod
+    def to_votes(results: BoardResults):
+        return [
+            Votes(id=idea.id, votes_count=idea.votes_count)
+            for idea in results.ideas
+            if idea.votes_count > 0
+        ]
 
-    async def get_winner(self, uow: DBWorkUnit, board_id: uuid.UUID):
-        async with uow:
-            counts = await self.get_voting_stats(uow, board_id)
+    @staticmethod
+    def to_percentages(results: BoardResults):
+        return [
+            Percentages(id=idea.id, percent_votes=idea.percent_votes)
+            for idea in results.ideas
+            if idea.votes_count > 0
+        ]
 
-            if len(counts) == 0:
-                return Winners(id=[], winners_count=0)
+    @staticmethod
+    def to_winners(results: BoardResults):
+        winners = [idea for idea in results.ideas if idea.is_winner]
 
-            winner_count = max(vote.votes_count for vote in counts)
-            winners_id = [vote.id for vote in counts if vote.votes_count == winner_count]
+        if len(winners) == 0:
+            return Winners(id=[], winners_count=0)
 
-            return Winners(id=winners_id, winners_count=winner_count)
+        return Winners(id=[idea.id for idea in winners], winners_count=winners[0].votes_count)
@@ -1,9 +1,11 @@
 import uuid
+from typing import Optional
 
 from src.adapters.db_work_unit import DBWorkUnit
 from src.adapters.logger import logger
 from src.domain.models.user import User
 from src.domain.models.vote import Vote
+from src.domain.schemas.page import Page, build_page, decode_cursor
 from src.domain.schemas.user import UserCreate, UserUpdateName, UserVoteStatistic
 from src.domain.schemas.vote import VoteUserStatWrap
 from src.exceptions.base import NotFoundException
@@ -34,24 +36,25 @@ class UserMaintainService:
 
     async def change_username(self, uow: DBWorkUnit, user_id: uuid.UUID, data: UserUpdateName):
         async with uow:
-            # Check if user exists
-            user = await self.get_user(uow, user_id)
+            user = await uow.repositories[User].update_name(user_id, **data.model_dump())
+
+            if user is None:
+                raise NotFoundException(User)
 
             logger.info(
                 "User's name was successfully updated",
                 extra={
                     "user_id": str(user_id),
-                    "old_name": user.name,
                     "new_name": data.name,
                 },
             )
 
-            return await uow.repositories[User].update_name(user_id, **data.model_dump())
+            return user
 
     async def delete_user(self, uow: DBWorkUnit, user_id: uuid.UUID):
         async with uow:
-            # Check if user exists
-            await self.get_user(uow, user_id)
+            if not await uow.repositories[User].delete(user_id):
+                raise NotFoundException(User)
 
             logger.info(
                 "User was successfully deleted but it's " "votes are kept in the system",
@@ -60,23 +63,29 @@ class UserMaintainService:
                 },
             )
 
-            await uow.repositories[User].delete(user_id)
+    async def get_votes_history(
+        self, uow: DBWorkUnit, user_id: uuid.UUID, limit: int, cursor: Optional[str] = None
+    ):
+        after = decode_cursor(cursor)
 
-    async def get_votes_history(self, uow: DBWorkUnit, user_id: uuid.UUID):
         async with uow:
             # Check if user exists
             await self.get_user(uow, user_id)
 
-            raw_result = await uow.repositories[Vote].get_user_votes(user_id)
-
-            return [
-                UserVoteStatistic(
-                    vote=VoteUserStatWrap(
-                        id=vote.id,
-                        idea_id=vote.idea_id,
-                    ),
-                    idea_title=title,
-                    board_id=board_id,
-                )
-                for vote, title, board_id in raw_result
-            ]
+            raw_result = await uow.repositories[Vote].get_user_votes(user_id, limit + 1, after)
+            page = build_page(raw_result, limit, key=lambda row: row[0].id)
+
+            return Page(
+                items=[
+                    UserVoteStatistic(
+                        vote=VoteUserStatWrap(
+                            id=vote.id,
+                            idea_id=vote.idea_id,
+                        ),
+                        idea_title=title,
+                        board_id=board_id,
+                    )
+                    for vote, title, board_id in page.items
+                ],
+                next_cursor=page.next_cursor,
+            )
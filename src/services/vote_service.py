@@ -1,7 +1,10 @@
 import uuid
+from functools import partial
+from typing import Optional
 
 from src.adapters.db_work_unit import DBWorkUnit
 from src.adapters.logger import logger
+from src.adapters.stats_cache import StatsCache, stats_cache
 from src.board_status import BoardStatus
 from src.domain.models.board import Board
 from src.domain.models.idea import Idea
@@ -14,62 +17,84 @@ from src.exceptions.vote import AlreadyVoted
 
 
 class VoteMaintainService:
+    def __init__(self, cache: Optional[StatsCache] = None):
+        self.cache = stats_cache if cache is None else cache
+
     async def create_vote(self, uow: DBWorkUnit, data: VoteCreate):
         async with uow:
             idea_id, user_id = data.model_dump().values()
 
-            if await uow.repositories[User].get(user_id) is None:
+            outcome = await uow.repositories[Vote].cast(idea_id, user_id)
+
+            if not outcome.user_exists:
                 raise NotFoundException(User)
 
-            idea = await uow.repositories[Idea].get(idea_id)
-            if idea is None:
+            if outcome.board_id is None:
                 raise NotFoundException(Idea)
 
-            board = await uow.repositories[Board].get(idea.board_id)
-
-            if board.status != BoardStatus.published:
+            if outcome.board_status != BoardStatus.published:
                 raise InvalidBoardStatus(
-                    current_state=board.status,
+                    current_state=outcome.board_status,
                     related_state=BoardStatus.published,
-                    board_id=board.id,
+                    board_id=outcome.board_id,
                     operation="voting",
                 )
 
-            if await uow.repositories[Vote].is_voted_already(user_id, board.id):
+            # Every check passed, so the insert was skipped by the unique constraint
+            if outcome.vote_id is None:
                 raise AlreadyVoted(
                     user_id=user_id,
-                    board_id=board.id,
+                    board_id=outcome.board_id,
                 )
 
-            new_vote = await uow.repositories[Vote].create(idea_id, user_id)
+            new_vote = Vote(
+                id=outcome.vote_id, idea_id=idea_id, user_id=user_id, board_id=outcome.board_id
+            )
+
+            uow.on_commit(partial(self.cache.invalidate, outcome.board_id))
 
             logger.info(
                 "User successfully voted for idea",
-                extra={"vote_id": str(new_vote.id), "board_id": str(board.id)},
+                extra={"vote_id": str(new_vote.id), "board_id": str(outcome.board_id)},
             )
 
             return new_vote
 
+    async def export_board_votes(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        # Checked before streaming starts: once the body is sent, errors can't become a 404
+        async with uow:
+            if await uow.repositories[Board].get(board_id) is None:
+                raise NotFoundException(Board)
+
+        return self._stream_board_votes(uow, board_id)
+
+    async def _stream_board_votes(self, uow: DBWorkUnit, board_id: uuid.UUID):
+        async with uow:
+            async for batch in uow.repositories[Vote].stream_board_votes(board_id):
+                yield batch
+
     async def delete_vote(self, uow: DBWorkUnit, vote_id: uuid.UUID):
         async with uow:
-            vote = await uow.repositories[Vote].get(vote_id)
-            if vote is None:
-                raise NotFoundException(Vote)
+            outcome = await uow.repositories[Vote].revoke(vote_id)
 
-            idea = await uow.repositories[Idea].get(vote.idea_id)
-            board = await uow.repositories[Board].get(idea.board_id)
+            if outcome.board_id is None:
+                raise NotFoundException(Vote)
 
-            if board.status != BoardStatus.published:
+            if outcome.board_status != BoardStatus.published:
                 raise InvalidBoardStatus(
-                    current_state=board.status,
+                    current_state=outcome.board_status,
                     related_state=BoardStatus.published,
-                    board_id=board.id,
+                    board_id=outcome.board_id,
                     operation="vote canceling",
                 )
 
+            # Board was published but a concurrent revoke got there first
+            if outcome.removed == 0:
+                raise NotFoundException(Vote)
+
             logger.info(
                 "Vote successfully canceled",
-                extra={"vote_id": str(vote_id), "board_id": str(board.id)},
+                extra={"vote_id": str(vote_id), "board_id": str(outcome.board_id)},
             )
 
-            await uow.repositories[Vote].delete(vote_id)
+            uow.on_commit(partial(self.cache.invalidate, outcome.board_id))
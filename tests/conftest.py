@@ -1,18 +1,23 @@
 import sys
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.adapters.db_work_unit import DBWorkUnit
+from src.adapters.stats_cache import stats_cache
 from src.app.di_frame import get_uow
 from src.app.main import app
+from src.config import settings
 from src.domain.models.board import Board
 from src.domain.models.idea import Idea
+from src.domain.models.snapshot import BoardSnapshot
 from src.domain.models.user import User
 from src.domain.models.vote import Vote
+from src.middleware.ratelimits import limiter
 from src.repositories.board_repo import BoardRepository
 from src.repositories.idea_repo import IdeaRepository
+from src.repositories.snapshot_repo import SnapshotRepository
 from src.repositories.user_repo import UserRepository
 from src.repositories.vote_repo import VoteRepository
 
@@ -25,7 +30,9 @@ pytest_plugins = ("pytest_asyncio",)
 
 @pytest.fixture
 def mock_board_repo():
-    return AsyncMock(spec=BoardRepository)
+    repo = AsyncMock(spec=BoardRepository)
+    repo.get_version.return_value = "1"
+    return repo
 
 
 @pytest.fixture
@@ -44,14 +51,33 @@ def mock_vote_repo():
 
 
 @pytest.fixture
-def mock_uow(mock_board_repo, mock_idea_repo, mock_user_repo, mock_vote_repo):
+def mock_snapshot_repo():
+    repo = AsyncMock(spec=SnapshotRepository)
+    repo.get.return_value = None
+    return repo
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    session.invalidate = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def mock_uow(mock_board_repo, mock_idea_repo, mock_user_repo, mock_vote_repo, mock_snapshot_repo):
     uow = AsyncMock(spec=DBWorkUnit)
     uow.repositories = {
         Board: mock_board_repo,
         Idea: mock_idea_repo,
         User: mock_user_repo,
         Vote: mock_vote_repo,
+        BoardSnapshot: mock_snapshot_repo,
     }
+    uow.pinned_to_primary = False
     uow.__aenter__.return_value = uow
     uow.__aexit__.return_value = None
     return uow
@@ -66,3 +92,21 @@ def override_dependency(mock_uow):
     yield mock_uow
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "metrics_enabled", True)
+    monkeypatch.setattr(settings, "metrics_token", "")
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    stats_cache.clear()
+    yield
+    stats_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+async def reset_rate_limits():
+    await limiter.storage.reset()
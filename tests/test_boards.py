@@ -1,11 +1,14 @@
 import uuid
+from types import SimpleNamespace
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from src.board_status import BoardStatus
+from src.config import settings
 from src.domain import constants
 from src.domain.models.board import Board
+from src.domain.models.snapshot import BoardSnapshot
 from src.domain.models.vote import Vote
 from src.domain.schemas.board import BoardCreate, BoardStatusUpdate
 from src.exceptions.base import NotFoundException
@@ -72,6 +75,7 @@ class TestBoardsService:
         board_id = sample_board.id
 
         mock_uow.repositories[Board].get.return_value = sample_board
+        mock_uow.repositories[Board].update_status.return_value = None
 
         data = BoardStatusUpdate(status=BoardStatus.published)
 
@@ -79,22 +83,82 @@ class TestBoardsService:
             await board_service.change_board_status(mock_uow, board_id, data)
 
         assert exc_info.value.current_state == BoardStatus.closed
+        mock_uow.repositories[BoardSnapshot].create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_status_change_of_missing_board(self, board_service, mock_uow):
+        mock_uow.repositories[Board].get.return_value = None
+        mock_uow.repositories[Board].update_status.return_value = None
+
+        data = BoardStatusUpdate(status=BoardStatus.closed)
+
+        with pytest.raises(NotFoundException):
+            await board_service.change_board_status(mock_uow, uuid.uuid4(), data)
 
     @pytest.mark.asyncio
     async def test_changing_to_draft_removes_all_votes(self, board_service, mock_uow, sample_board):
         sample_board.status = BoardStatus.published
         board_id = sample_board.id
 
-        vote_ids = [uuid.uuid4(), uuid.uuid4()]
+        mock_uow.repositories[Board].get.return_value = sample_board
+        mock_uow.repositories[Vote].count_board_votes.return_value = 2
+        mock_uow.repositories[Vote].delete_board_votes.return_value = 2
+        mock_uow.repositories[Board].update_status.return_value = sample_board
+
+        data = BoardStatusUpdate(status=BoardStatus.draft)
+        await board_service.change_board_status(mock_uow, board_id, data)
+
+        mock_uow.repositories[Vote].delete_board_votes.assert_called_once_with(
+            board_id, board_status=BoardStatus.draft
+        )
+        mock_uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_board_purged_in_chunks(
+        self, board_service, mock_uow, sample_board, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "vote_purge_chunk_threshold", 3)
+        monkeypatch.setattr(settings, "vote_purge_chunk_size", 2)
+        sample_board.status = BoardStatus.published
+        board_id = sample_board.id
 
         mock_uow.repositories[Board].get.return_value = sample_board
-        mock_uow.repositories[Vote].get_board_votes.return_value = vote_ids
+        mock_uow.repositories[Vote].count_board_votes.return_value = 5
+        mock_uow.repositories[Vote].delete_board_votes.side_effect = [2, 2, 1]
         mock_uow.repositories[Board].update_status.return_value = sample_board
 
         data = BoardStatusUpdate(status=BoardStatus.draft)
         await board_service.change_board_status(mock_uow, board_id, data)
 
-        mock_uow.repositories[Vote].vote_mass_delete.assert_called_once_with(vote_ids)
+        assert mock_uow.repositories[Vote].delete_board_votes.call_count == 3
+        mock_uow.repositories[Vote].delete_board_votes.assert_called_with(
+            board_id, 2, BoardStatus.draft
+        )
+        # Draft status first, then one commit per chunk
+        assert mock_uow.commit.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_closing_board_freezes_results(self, board_service, mock_uow, sample_board):
+        sample_board.status = BoardStatus.published
+        board_id = sample_board.id
+
+        mock_uow.repositories[Board].get.return_value = sample_board
+        mock_uow.repositories[Board].update_status.return_value = sample_board
+        mock_uow.repositories[Vote].get_board_results.return_value = [
+            SimpleNamespace(
+                idea_id=uuid.uuid4(),
+                votes_count=1,
+                total_votes=1,
+                percent_votes=100.0,
+                rank=1,
+                is_winner=True,
+            )
+        ]
+
+        data = BoardStatusUpdate(status=BoardStatus.closed)
+        await board_service.change_board_status(mock_uow, board_id, data)
+
+        mock_uow.repositories[BoardSnapshot].create.assert_called_once()
 
 
 from src.app.main import app
@@ -0,0 +1,229 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from src.adapters.circuit_breaker import CircuitBreaker, CircuitState, breaker_for
+from src.adapters.db_work_unit import DBWorkUnit
+from src.app.main import app
+from src.app.storage_setup import async_session_factory
+from src.exceptions.base import DatabaseUnavailable
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        return CircuitBreaker(
+            window=4, min_calls=4, failure_rate=0.5, reset_timeout=10, clock=clock
+        )
+
+    def test_opens_on_failure_rate(self, breaker):
+        for failed in (False, True, False):
+            breaker.release(breaker.acquire(), failed)
+        assert breaker.state == CircuitState.closed
+
+        breaker.release(breaker.acquire(), True)
+
+        assert breaker.state == CircuitState.open
+        assert breaker.stats()["opened"] == 1
+
+    def test_fails_fast_while_open(self, breaker):
+        for _ in range(4):
+            breaker.release(breaker.acquire(), True)
+
+        with pytest.raises(DatabaseUnavailable) as raised:
+            breaker.acquire()
+
+        assert 10 <= raised.value.retry_after <= 15
+        assert raised.value.headers == {"Retry-After": str(raised.value.retry_after)}
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_lets_one_probe_through(self, breaker, clock):
+        for _ in range(4):
+            breaker.release(breaker.acquire(), True)
+        clock.now = 10
+
+        assert breaker.acquire() is True
+        assert breaker.state == CircuitState.half_open
+
+        with pytest.raises(DatabaseUnavailable):
+            breaker.acquire()
+
+    def test_successful_probe_closes(self, breaker, clock):
+        for _ in range(4):
+            breaker.release(breaker.acquire(), True)
+        clock.now = 10
+
+        breaker.release(breaker.acquire(), False)
+
+        assert breaker.state == CircuitState.closed
+        assert breaker.acquire() is False
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        for _ in range(4):
+            breaker.release(breaker.acquire(), True)
+        clock.now = 10
+
+        breaker.release(breaker.acquire(), True)
+
+        assert breaker.state == CircuitState.open
+        with pytest.raises(DatabaseUnavailable):
+            breaker.acquire()
+
+    def test_logs_transitions_once(self, breaker, clock, caplog):
+        for _ in range(4):
+            breaker.release(breaker.acquire(), True)
+        for _ in range(3):
+            with pytest.raises(DatabaseUnavailable):
+                breaker.acquire()
+        clock.now = 10
+        breaker.release(breaker.acquire(), False)
+
+        assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+            (logging.ERROR, "Database circuit breaker opened"),
+            (logging.WARNING, "Database circuit breaker closed"),
+        ]
+
+    def test_cancelled_probe_frees_its_slot(self, breaker, clock):
+        for _ in range(4):
+            breaker.release(breaker.acquire(), True)
+        clock.now = 10
+
+        breaker.release(breaker.acquire(), None)
+
+        assert breaker.state == CircuitState.half_open
+        assert breaker.acquire() is True
+
+
+class TestWorkUnitBreaker:
+    @pytest.fixture
+    def session_factory(self, session):
+        return MagicMock(return_value=session)
+
+    @pytest.fixture
+    def breaker(self, session_factory):
+        return breaker_for(session_factory)
+
+    @staticmethod
+    async def run_unit(session_factory, error: BaseException):
+        async with DBWorkUnit(session_factory) as uow:
+            uow.session
+            raise error
+
+    @pytest.mark.asyncio
+    async def test_connection_failure_becomes_503(self, session_factory, breaker):
+        with pytest.raises(DatabaseUnavailable) as raised:
+            await self.run_unit(session_factory, ConnectionRefusedError())
+
+        assert isinstance(raised.value.__cause__, ConnectionRefusedError)
+        assert breaker.stats()["calls"] == 1
+        assert breaker.stats()["failure_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_connect_timeout_counts(self, session_factory, session, breaker):
+        with pytest.raises(DatabaseUnavailable):
+            await self.run_unit(session_factory, asyncio.TimeoutError())
+
+        assert breaker.stats()["failure_rate"] == 1.0
+        session.invalidate.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalidated_connection_counts(self, session_factory, breaker):
+        error = DBAPIError("SELECT 1", {}, Exception(), connection_invalidated=True)
+
+        with pytest.raises(DatabaseUnavailable):
+            await self.run_unit(session_factory, error)
+
+        assert breaker.stats()["failure_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_query_errors_do_not_count(self, session_factory, breaker):
+        error = IntegrityError("INSERT", {}, SimpleNamespace(sqlstate="23505"))
+
+        with pytest.raises(IntegrityError):
+            await self.run_unit(session_factory, error)
+
+        assert breaker.stats()["failure_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_the_session(self, session_factory, breaker):
+        for _ in range(breaker.min_calls):
+            with pytest.raises(DatabaseUnavailable):
+                await self.run_unit(session_factory, ConnectionRefusedError())
+        assert breaker.state == CircuitState.open
+        session_factory.reset_mock()
+
+        with pytest.raises(DatabaseUnavailable):
+            await self.run_unit(session_factory, AssertionError())
+
+        session_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_commit_failure_counts(self, session_factory, session, breaker):
+        session.commit.side_effect = ConnectionResetError()
+
+        with pytest.raises(DatabaseUnavailable):
+            async with DBWorkUnit(session_factory) as uow:
+                uow.session
+
+        assert breaker.stats()["failure_rate"] == 1.0
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_neutral(self, session_factory, breaker):
+        with pytest.raises(asyncio.CancelledError):
+            await self.run_unit(session_factory, asyncio.CancelledError())
+
+        assert breaker.stats()["calls"] == 0
+
+
+class TestReadiness:
+    @pytest.fixture
+    def primary_breaker(self):
+        breaker = breaker_for(async_session_factory)
+        yield breaker
+        breaker._close()
+
+    @pytest.mark.asyncio
+    async def test_ready_from_closed_breaker(self, primary_breaker):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready", "database": "closed"}
+
+    @pytest.mark.asyncio
+    async def test_not_ready_while_open(self, primary_breaker, metrics_enabled, caplog):
+        primary_breaker._open()
+        caplog.clear()
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/ready")
+            metrics = await client.get("/metrics/circuit_breaker")
+
+        assert response.status_code == 503
+        assert response.headers["content-type"] == "application/problem+json"
+        assert response.json()["type"] == "/errors/database_unavailable"
+        assert int(response.headers["Retry-After"]) >= 1
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
+
+        assert metrics.json()["primary"]["state"] == "open"
@@ -1,7 +1,9 @@
 import pytest
 from httpx import ASGITransport, AsyncClient
+from starlette.responses import PlainTextResponse
 
 from src.app.main import app
+from src.middleware.cors_policy import SecurityHeadersMiddleware
 
 pytestmark = pytest.mark.asyncio
 
@@ -50,3 +52,29 @@ class TestSecurityHeadersNegative:
             response = await client.get("/health")
 
         assert "x-powered-by" not in response.headers
+
+
+class TestSecurityHeadersMiddleware:
+    async def test_hsts_only_in_production(self):
+        async def endpoint(scope, receive, send):
+            await PlainTextResponse("ok")(scope, receive, send)
+
+        production = SecurityHeadersMiddleware(endpoint, environment="production")
+        development = SecurityHeadersMiddleware(endpoint)
+
+        async with AsyncClient(transport=ASGITransport(app=production), base_url="http://t") as c:
+            assert "strict-transport-security" in (await c.get("/")).headers
+        async with AsyncClient(transport=ASGITransport(app=development), base_url="http://t") as c:
+            assert "strict-transport-security" not in (await c.get("/")).headers
+
+    async def test_overrides_header_set_by_endpoint(self):
+        async def endpoint(scope, receive, send):
+            response = PlainTextResponse("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+            await response(scope, receive, send)
+
+        app = SecurityHeadersMiddleware(endpoint)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            response = await client.get("/")
+
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
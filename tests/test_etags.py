@@ -0,0 +1,183 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.adapters.stats_cache import StatsCache, stats_cache
+from src.app.main import app
+from src.board_status import BoardStatus
+from src.domain.models.board import Board
+from src.domain.models.idea import Idea
+from src.domain.models.vote import Vote
+from src.domain.schemas.idea import IdeaCreate, IdeaUpdateTitle
+from src.routers.conditional import board_etag
+from src.services.idea_service import IdeaMaintainService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def board():
+    return Board(id=uuid.uuid4(), title="Board", status=BoardStatus.published)
+
+
+@pytest.fixture
+def client():
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestVersionCache:
+    def test_version_dropped_on_invalidation(self):
+        cache = StatsCache(max_size=16, ttl=60)
+        board_id = uuid.uuid4()
+
+        cache.set_version(board_id, "3")
+        assert cache.get_version(board_id) == "3"
+
+        cache.invalidate(board_id)
+        assert cache.get_version(board_id) is None
+
+    def test_new_version_drops_cached_results(self):
+        cache = StatsCache(max_size=16, ttl=60)
+        board_id = uuid.uuid4()
+
+        cache.set_version(board_id, "3")
+        cache.set(board_id, "results")
+        cache.set_version(board_id, "3")
+        assert cache.get(board_id) == "results"
+
+        cache.set_version(board_id, "4")
+        assert cache.get(board_id) is None
+
+    def test_stale_version_not_stored_after_invalidation(self):
+        cache = StatsCache(max_size=16, ttl=60)
+        board_id = uuid.uuid4()
+
+        generation = cache.generation(board_id)
+        cache.invalidate(board_id)
+        cache.set_version(board_id, "3", generation)
+
+        assert cache.get_version(board_id) is None
+
+
+class TestConditionalGet:
+    @pytest.mark.asyncio
+    async def test_board_carries_etag(self, client, mock_board_repo, board):
+        mock_board_repo.get.return_value = board
+        mock_board_repo.get_version.return_value = "7"
+
+        async with client:
+            response = await client.get(f"/boards/{board.id}")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == board_etag(board.id, "7")
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_skips_the_read(self, client, mock_board_repo, board):
+        etag = board_etag(board.id, "1")
+
+        async with client:
+            response = await client.get(f"/boards/{board.id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        mock_board_repo.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cached_version_skips_the_database(self, client, mock_uow, board):
+        stats_cache.set_version(board.id, "1")
+
+        async with client:
+            response = await client.get(
+                f"/boards/{board.id}/results", headers={"If-None-Match": board_etag(board.id, "1")}
+            )
+
+        assert response.status_code == 304
+        mock_uow.__aenter__.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_pinned_client_checks_current_version(self, client, mock_uow, board):
+        stats_cache.set_version(board.id, "1")
+        mock_uow.pinned_to_primary = True
+        mock_uow.repositories[Board].get.return_value = board
+        mock_uow.repositories[Board].get_version.return_value = "2"
+
+        async with client:
+            response = await client.get(
+                f"/boards/{board.id}", headers={"If-None-Match": board_etag(board.id, "1")}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == board_etag(board.id, "2")
+
+    @pytest.mark.asyncio
+    async def test_changed_board_served_in_full(self, client, mock_uow, board):
+        mock_uow.repositories[Board].get_version.return_value = "2"
+        mock_uow.repositories[Vote].get_board_results.return_value = [
+            SimpleNamespace(
+                idea_id=None,
+                votes_count=None,
+                total_votes=0,
+                percent_votes=0.0,
+                rank=1,
+                is_winner=False,
+            )
+        ]
+
+        async with client:
+            response = await client.get(
+                f"/boards/{board.id}/winners", headers={"If-None-Match": board_etag(board.id, "1")}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == board_etag(board.id, "2")
+
+    @pytest.mark.asyncio
+    async def test_weak_and_listed_etags_match(self, client, board):
+        header = f'"other", W/{board_etag(board.id, "1")}'
+
+        async with client:
+            response = await client.get(
+                f"/ideas/all?board_id={board.id}", headers={"If-None-Match": header}
+            )
+
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_missing_board_has_no_etag(self, client, mock_board_repo, board):
+        mock_board_repo.get_version.return_value = None
+        mock_board_repo.get.return_value = None
+
+        async with client:
+            response = await client.get(f"/boards/{board.id}", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+
+class TestVersionBumps:
+    @pytest.mark.asyncio
+    async def test_new_idea_bumps_board(self, mock_uow, mock_board_repo, board):
+        board.status = BoardStatus.draft
+        mock_board_repo.get.return_value = board
+
+        await IdeaMaintainService().create_idea(
+            mock_uow, IdeaCreate(title="Idea", description="Description", board_id=board.id)
+        )
+
+        mock_board_repo.bump_version.assert_awaited_once_with(board.id)
+
+    @pytest.mark.asyncio
+    async def test_renamed_idea_bumps_board(self, mock_uow, mock_board_repo, board):
+        idea = Idea(id=uuid.uuid4(), title="Idea", description="Description", board_id=board.id)
+        mock_uow.repositories[Idea].update_title.return_value = idea
+        stats_cache.set_version(board.id, "1")
+
+        await IdeaMaintainService().change_title(mock_uow, idea.id, IdeaUpdateTitle(title="New"))
+
+        mock_board_repo.bump_version.assert_awaited_once_with(board.id)
+        (hook,), _ = mock_uow.on_commit.call_args
+        hook()
+        assert stats_cache.get_version(board.id) is None
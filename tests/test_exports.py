@@ -0,0 +1,72 @@
+import json
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.app.main import app
+from src.board_status import BoardStatus
+from src.domain.models.board import Board
+from src.domain.models.idea import Idea
+from src.domain.models.vote import Vote
+
+pytestmark = pytest.mark.asyncio
+
+
+def batches(*chunks):
+    async def _stream(*args):
+        for chunk in chunks:
+            yield chunk
+
+    return _stream
+
+
+class TestStreamingExports:
+    async def test_boards_exported_as_ndjson(self, mock_uow):
+        rows = [
+            {"id": uuid.uuid4(), "title": f"Board {i}", "status": BoardStatus.draft}
+            for i in range(3)
+        ]
+        mock_uow.repositories[Board].stream_all = batches(rows[:2], rows[2:])
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/boards/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == [str(row["id"]) for row in rows]
+
+    async def test_ideas_export_for_missing_board_is_404(self, mock_uow):
+        mock_uow.repositories[Board].get.return_value = None
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/ideas/export", params={"board_id": str(uuid.uuid4())})
+
+        assert response.status_code == 404
+        mock_uow.repositories[Idea].stream_from_one_board.assert_not_called()
+
+    async def test_votes_exported_for_board(self, mock_uow):
+        board_id = uuid.uuid4()
+        row = {"id": uuid.uuid4(), "idea_id": uuid.uuid4(), "user_id": uuid.uuid4()}
+
+        mock_uow.repositories[Board].get.return_value = Board(
+            id=board_id, title="Board", status=BoardStatus.published
+        )
+        mock_uow.repositories[Vote].stream_board_votes = batches([row])
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/votes/export", params={"board_id": str(board_id)})
+
+        assert response.status_code == 200
+        assert json.loads(response.text) == {key: str(value) for key, value in row.items()}
+
+    async def test_empty_export_has_empty_body(self, mock_uow):
+        mock_uow.repositories[Board].stream_all = batches()
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/boards/export")
+
+        assert response.status_code == 200
+        assert response.text == ""
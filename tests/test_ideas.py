@@ -84,6 +84,7 @@ class TestIdeasService:
     ):
         sample_board.status = BoardStatus.published
 
+        mock_uow.repositories[Idea].update_title.return_value = None
         mock_uow.repositories[Idea].get.return_value = sample_idea
         mock_uow.repositories[Board].get.return_value = sample_board
 
@@ -92,6 +93,27 @@ class TestIdeasService:
         with pytest.raises(InvalidBoardStatus):
             await idea_service.change_title(mock_uow, sample_idea.id, data)
 
+    @pytest.mark.asyncio
+    async def test_idea_updated_in_one_statement(self, idea_service, mock_uow, sample_idea):
+        mock_uow.repositories[Idea].update_title.return_value = sample_idea
+
+        data = IdeaUpdateTitle(title="New Title")
+        await idea_service.change_title(mock_uow, sample_idea.id, data)
+
+        mock_uow.repositories[Idea].update_title.assert_called_once_with(
+            sample_idea.id, title="New Title", board_status=BoardStatus.draft
+        )
+        mock_uow.repositories[Idea].get.assert_not_called()
+        mock_uow.repositories[Board].get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deleting_nonexistent_idea_raises_error(self, idea_service, mock_uow):
+        mock_uow.repositories[Idea].delete.return_value = None
+        mock_uow.repositories[Idea].get.return_value = None
+
+        with pytest.raises(NotFoundException):
+            await idea_service.delete_idea(mock_uow, uuid.uuid4())
+
 
 from src.app.main import app
 
@@ -0,0 +1,37 @@
+import time
+import uuid
+
+import pytest
+
+from src.domain.models.board import Board
+from src.domain.models.idea import Idea
+from src.domain.models.ids import uuid7
+from src.domain.models.user import User
+from src.domain.models.vote import Vote
+
+pytestmark = pytest.mark.unit
+
+
+class TestUuid7:
+    def test_version_and_variant(self):
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_current_time(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after + 1
+
+    def test_ids_are_ordered_within_a_millisecond(self):
+        values = [uuid7() for _ in range(10000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+
+    @pytest.mark.parametrize("model", [Board, Idea, User, Vote])
+    def test_models_default_to_uuid7(self, model):
+        assert model.__table__.c.id.default.arg(None).version == 7
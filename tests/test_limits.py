@@ -1,35 +1,164 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import ASGITransport, AsyncClient
+from limits import parse
+from limits.errors import StorageError
+from starlette.responses import PlainTextResponse, StreamingResponse
 
+from src.adapters import deadline
 from src.app.main import app
+from src.middleware.ratelimits import (
+    RateLimiter,
+    RequestTimeoutMiddleware,
+    limiter,
+    parse_route_timeouts,
+    timeout_counts,
+)
 
 pytestmark = pytest.mark.asyncio
 
 
 class TestRateLimiting:
-    # Doesn't work right now but you get the logic
-    # async def test_rate_limit_returns_429(self, mock_uow):
-    #     async with AsyncClient(
-    #             transport=ASGITransport(app=app),
-    #             base_url="http://test"
-    #     ) as client:
-    #         responses = []
-    #         for _ in range(150):
-    #             response = await client.get("/health")
-    #             responses.append(response.status_code)
-    #
-    #         assert 429 in responses
-
-    async def test_rate_limit_response_format(self, mock_uow):
+    @pytest.fixture
+    def small_limit(self, monkeypatch):
+        monkeypatch.setattr(limiter, "item", parse("10/minute"))
+
+    async def test_reads_limited_with_computed_retry_after(
+        self, mock_uow, mock_user_repo, small_limit
+    ):
+        mock_user_repo.get.return_value = None
+        user_id = uuid.uuid4()
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            statuses = [(await client.get(f"/users/{user_id}")).status_code for _ in range(10)]
+            response = await client.get(f"/users/{user_id}")
+
+        assert 429 not in statuses
+        assert response.status_code == 429
+
+        data = response.json()
+        assert data["type"] == "/errors/too_many_requests"
+        assert data["status"] == 429
+        assert 1 <= int(response.headers["Retry-After"]) <= 60
+
+    async def test_vote_writes_cost_more_than_reads(self, mock_uow, small_limit):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.delete(f"/votes/{uuid.uuid4()}/revoke")
+            second = await client.delete(f"/votes/{uuid.uuid4()}/revoke")
+            third = await client.delete(f"/votes/{uuid.uuid4()}/revoke")
+
+        assert first.status_code != 429
+        assert second.status_code != 429
+        assert third.status_code == 429
+
+    async def test_health_not_limited(self, small_limit):
         async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            for _ in range(150):
-                response = await client.get("/health")
+            statuses = {(await client.get("/health")).status_code for _ in range(20)}
+
+        assert statuses == {200}
+
+    async def test_clients_limited_separately(self):
+        rate_limiter = RateLimiter("1/minute", "async+memory://")
+
+        assert await rate_limiter.hit("10.0.0.1") is None
+        assert await rate_limiter.hit("10.0.0.2") is None
+        assert await rate_limiter.hit("10.0.0.1") is not None
+
+    async def test_unavailable_storage_lets_requests_through(self, monkeypatch):
+        rate_limiter = RateLimiter("1/minute", "async+memory://")
+        failing = AsyncMock(side_effect=StorageError(OSError()))
+        monkeypatch.setattr(rate_limiter.strategy, "hit", failing)
+
+        assert await rate_limiter.hit("10.0.0.1") is None
+
+
+class TestRequestTimeout:
+    async def test_slow_handler_gets_504(self):
+        async def endpoint(scope, receive, send):
+            await asyncio.sleep(1)
+            await PlainTextResponse("late")(scope, receive, send)
+
+        app = RequestTimeoutMiddleware(endpoint, timeout=0.05)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            response = await client.get("/")
+
+        assert response.status_code == 504
+        assert response.json()["status"] == 504
+
+    async def test_started_stream_is_not_cut_off(self):
+        async def chunks():
+            for _ in range(3):
+                await asyncio.sleep(0.05)
+                yield b"chunk"
+
+        async def endpoint(scope, receive, send):
+            await StreamingResponse(chunks())(scope, receive, send)
+
+        app = RequestTimeoutMiddleware(endpoint, timeout=0.1)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            response = await client.get("/")
+
+        assert response.status_code == 200
+        assert response.content == b"chunk" * 3
+
+    async def test_route_timeout_overrides_default(self):
+        async def endpoint(scope, receive, send):
+            await asyncio.sleep(0.2)
+            await PlainTextResponse("ok")(scope, receive, send)
+
+        app = RequestTimeoutMiddleware(
+            endpoint, timeout=0.05, route_timeouts=parse_route_timeouts("/slow=1, /slow/x=0.05")
+        )
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            assert (await client.get("/slow/report")).status_code == 200
+            assert (await client.get("/slow/x")).status_code == 504
+            assert (await client.get("/other")).status_code == 504
+
+    async def test_remaining_budget_published_to_handler(self):
+        budgets = []
+
+        async def endpoint(scope, receive, send):
+            budgets.append(deadline.remaining())
+            await PlainTextResponse("ok")(scope, receive, send)
+            budgets.append(deadline.remaining())
+
+        app = RequestTimeoutMiddleware(endpoint, timeout=2)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as client:
+            await client.get("/")
+
+        assert 1.5 < budgets[0] <= 2
+        assert budgets[1] is None
+
+    async def test_timeouts_counted_per_route(self, mock_uow, metrics_enabled):
+        timeout_counts.clear()
+
+        async def endpoint(scope, receive, send):
+            await asyncio.sleep(1)
+
+        main_app = SimpleNamespace(router=app.router)
+        middleware = RequestTimeoutMiddleware(endpoint, timeout=0.01)
+
+        async def with_app(scope, receive, send):
+            await middleware({**scope, "app": main_app}, receive, send)
+
+        async with AsyncClient(transport=ASGITransport(app=with_app), base_url="http://t") as c:
+            await c.get(f"/boards/{uuid.uuid4()}")
+            await c.get(f"/boards/{uuid.uuid4()}")
+            await c.get(f"/users/{uuid.uuid4()}")
 
-                if response.status_code == 429:
-                    data = response.json()
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            metrics = (await c.get("/metrics/timeouts")).json()
 
-                    assert "type" in data
-                    assert "title" in data
-                    assert data["status"] == 429
-                    assert "retry_after" in response.headers or "Retry-After" in response.headers
-                    break
+        assert metrics == {
+            "total": 3,
+            "routes": {"GET /boards/{board_id}": 2, "GET /users/{user_id}": 1},
+        }
+        timeout_counts.clear()
@@ -0,0 +1,223 @@
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+
+from src.config import settings
+from src.domain.models.base import Base
+from src.migrations import helpers
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(TEST_DATABASE_URL is None, reason="TEST_DATABASE_URL is not set"),
+]
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA = "migration_helpers"
+MIGRATION_LOCK_KEY = 7318290546
+PARTITION_MIGRATION = ROOT / "src/migrations/versions/5d8e1b3c7a92_partition_vote_by_board.py"
+
+# 3 boards of 2 ideas, each of 10 users votes on every board
+VOTES_SEED = """
+    INSERT INTO board (id, title, status) SELECT gen_random_uuid(), 'board', 'published'
+    FROM generate_series(1, 3);
+    INSERT INTO idea (id, title, board_id) SELECT gen_random_uuid(), 'idea', board.id
+    FROM board CROSS JOIN generate_series(1, 2);
+    INSERT INTO "user" (id, name, is_deleted) SELECT gen_random_uuid(), 'user', false
+    FROM generate_series(1, 10);
+    INSERT INTO vote (id, idea_id, user_id, board_id)
+    SELECT gen_random_uuid(), idea.id, "user".id, idea.board_id
+    FROM "user" CROSS JOIN LATERAL (
+        SELECT DISTINCT ON (board_id) id, board_id FROM idea ORDER BY board_id, random()
+    ) AS idea;
+"""
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(TEST_DATABASE_URL.replace("+asyncpg", "+psycopg2"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def connection(engine):
+    with engine.connect() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        connection.execute(text(f"SET search_path TO {SCHEMA}"))
+        connection.execute(
+            text("CREATE TABLE item (id serial PRIMARY KEY, value int, doubled int)")
+        )
+        connection.execute(
+            text("INSERT INTO item (value) SELECT n FROM generate_series(1, 2500) AS n")
+        )
+        connection.commit()
+
+        yield connection
+
+        connection.rollback()
+        connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        connection.commit()
+
+
+@pytest.fixture
+def migration(connection):
+    # Same setup env.py gives a migration: its own transaction, autocommit blocks allowed
+    context = MigrationContext.configure(connection, opts={"transaction_per_migration": True})
+
+    with Operations.context(context):
+        with context.begin_transaction(_per_migration=True):
+            yield connection
+
+
+class TestOnlineHelpers:
+    def test_index_built_concurrently(self, migration):
+        helpers.create_index_concurrently("ix_item_value", "item", ["value"])
+
+        assert helpers._index_is_valid("ix_item_value") is True
+
+    def test_index_creation_is_rerunnable(self, migration):
+        helpers.create_index_concurrently("ix_item_value", "item", ["value"])
+        helpers.create_index_concurrently("ix_item_value", "item", ["value"])
+
+        assert helpers._index_is_valid("ix_item_value") is True
+
+    def test_backfill_runs_in_batches(self, migration):
+        updated = helpers.batched_backfill(
+            "item", "doubled = value * 2", "doubled IS NULL", batch_size=1000
+        )
+
+        assert updated == 2500
+        pending = migration.execute(text("SELECT count(*) FROM item WHERE doubled IS NULL"))
+        assert pending.scalar_one() == 0
+
+    def test_not_valid_check_validated_separately(self, migration):
+        helpers.batched_backfill("item", "doubled = value * 2", "doubled IS NULL")
+        helpers.add_check_not_valid("ck_item_doubled", "item", "doubled IS NOT NULL")
+
+        validated = text("SELECT convalidated FROM pg_constraint WHERE conname = :name")
+        assert migration.execute(validated, {"name": "ck_item_doubled"}).scalar_one() is False
+
+        helpers.validate_constraint("item", "ck_item_doubled")
+
+        assert migration.execute(validated, {"name": "ck_item_doubled"}).scalar_one() is True
+
+    def test_not_null_set_through_validated_check(self, migration):
+        helpers.batched_backfill("item", "doubled = value * 2", "doubled IS NULL")
+        helpers.set_not_null("item", "doubled")
+
+        nullable = migration.execute(
+            text(
+                "SELECT is_nullable FROM information_schema.columns"
+                " WHERE table_schema = :schema AND table_name = 'item' AND column_name = 'doubled'"
+            ),
+            {"schema": SCHEMA},
+        )
+        assert nullable.scalar_one() == "NO"
+        leftover = text("SELECT count(*) FROM pg_constraint WHERE conname = :name")
+        assert migration.execute(leftover, {"name": "ck_item_doubled_not_null"}).scalar_one() == 0
+
+    def test_unique_constraint_from_concurrent_index(self, migration):
+        helpers.add_unique_constraint_concurrently("uq_item_value", "item", ["value"])
+
+        constraint = migration.execute(
+            text("SELECT contype FROM pg_constraint WHERE conname = 'uq_item_value'")
+        )
+        assert constraint.scalar_one() == "u"
+
+
+@pytest.fixture
+def partitioning(connection, monkeypatch):
+    # The vote partitioning migration applied to a copy of the schema in the scratch schema
+    Base.metadata.create_all(connection)
+    connection.execute(text(VOTES_SEED))
+    connection.commit()
+
+    spec = importlib.util.spec_from_file_location("partition_vote", PARTITION_MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    monkeypatch.setattr(settings, "vote_partitions", 4)
+
+    return module
+
+
+def partitions(connection):
+    attached = connection.execute(
+        text("SELECT count(*) FROM pg_inherits WHERE inhparent = to_regclass(:parent)::oid"),
+        {"parent": f"{SCHEMA}.vote"},
+    )
+    return attached.scalar_one()
+
+
+class TestVotePartitioning:
+    def test_votes_moved_into_hash_partitions(self, partitioning, migration):
+        partitioning.upgrade()
+
+        assert partitions(migration) == 4
+        assert migration.execute(text("SELECT count(*) FROM vote")).scalar_one() == 30
+
+    def test_board_queries_are_pruned(self, partitioning, migration):
+        partitioning.upgrade()
+        board_id = migration.execute(text("SELECT board_id FROM vote LIMIT 1")).scalar_one()
+
+        plan = migration.execute(
+            text("EXPLAIN (FORMAT JSON) SELECT * FROM vote WHERE board_id = :board_id"),
+            {"board_id": board_id},
+        ).scalar_one()[0]["Plan"]
+
+        assert plan["Node Type"] != "Append"
+
+    def test_one_vote_per_board_still_enforced(self, partitioning, migration):
+        partitioning.upgrade()
+
+        with pytest.raises(IntegrityError):
+            migration.execute(
+                text(
+                    "INSERT INTO vote (id, idea_id, user_id, board_id)"
+                    " SELECT gen_random_uuid(), idea_id, user_id, board_id FROM vote LIMIT 1"
+                )
+            )
+
+    def test_skipped_unless_enabled(self, partitioning, migration, monkeypatch):
+        monkeypatch.setattr(settings, "vote_partitions", 0)
+
+        partitioning.upgrade()
+
+        assert partitions(migration) == 0
+
+    def test_downgrade_restores_plain_table(self, partitioning, migration):
+        partitioning.upgrade()
+        partitioning.downgrade()
+
+        assert partitions(migration) == 0
+        assert migration.execute(text("SELECT count(*) FROM vote")).scalar_one() == 30
+
+
+class TestMigrationLock:
+    def test_upgrade_waits_for_running_migration(self, engine):
+        env = {**os.environ, "DATABASE_URL": TEST_DATABASE_URL}
+
+        with engine.connect() as holder:
+            holder.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+            upgrade = subprocess.Popen(
+                [sys.executable, "-m", "alembic", "upgrade", "head"], cwd=ROOT, env=env
+            )
+
+            with pytest.raises(subprocess.TimeoutExpired):
+                upgrade.wait(timeout=3)
+
+            holder.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+        assert upgrade.wait(timeout=60) == 0
@@ -0,0 +1,88 @@
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.app.main import app
+from src.board_status import BoardStatus
+from src.domain.models.board import Board
+from src.domain.schemas.page import build_page, decode_cursor, encode_cursor
+from src.exceptions.pagination import InvalidCursor
+from src.services.board_service import BoardMaintainService
+
+pytestmark = pytest.mark.unit
+
+
+def make_boards(count):
+    return sorted(
+        (
+            Board(id=uuid.uuid4(), title=f"Board {i}", status=BoardStatus.draft)
+            for i in range(count)
+        ),
+        key=lambda board: board.id,
+    )
+
+
+class TestCursor:
+    def test_cursor_round_trip(self):
+        last_id = uuid.uuid4()
+
+        assert decode_cursor(encode_cursor(last_id)) == last_id
+
+    def test_missing_cursor_means_first_page(self):
+        assert decode_cursor(None) is None
+
+    @pytest.mark.parametrize("cursor", ["not a cursor", "AAAA", "%%%"])
+    def test_malformed_cursor_rejected(self, cursor):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor)
+
+    def test_extra_row_produces_next_cursor(self):
+        boards = make_boards(3)
+
+        page = build_page(boards, limit=2)
+
+        assert page.items == boards[:2]
+        assert decode_cursor(page.next_cursor) == boards[1].id
+
+    def test_last_page_has_no_cursor(self):
+        page = build_page(make_boards(2), limit=2)
+
+        assert page.next_cursor is None
+
+
+class TestBoardListPagination:
+    @pytest.mark.asyncio
+    async def test_next_page_continues_after_cursor(self, mock_uow):
+        boards = make_boards(2)
+        mock_uow.repositories[Board].get_all.return_value = boards
+
+        cursor = encode_cursor(boards[0].id)
+        await BoardMaintainService().get_board_list(mock_uow, 1, cursor)
+
+        mock_uow.repositories[Board].get_all.assert_called_once_with(2, boards[0].id)
+
+    async def test_board_list_endpoint_returns_page(self, mock_uow):
+        boards = make_boards(3)
+        mock_uow.repositories[Board].get_all.return_value = boards
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/boards/all", params={"limit": 2})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [str(board.id) for board in boards[:2]]
+        assert decode_cursor(data["next_cursor"]) == boards[1].id
+
+    async def test_invalid_cursor_is_bad_request(self, mock_uow):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/boards/all", params={"cursor": "garbage"})
+
+        assert response.status_code == 400
+        assert response.json()["title"] == "invalid_pagination_cursor"
+
+    async def test_limit_is_capped(self, mock_uow):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/boards/all", params={"limit": 100000})
+
+        assert response.status_code == 422
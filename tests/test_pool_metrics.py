@@ -0,0 +1,128 @@
+import asyncio
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from src.adapters.pool_metrics import InstrumentedAsyncPool
+from src.app.main import app
+from src.app.storage_setup import engine
+from src.exceptions.base import ServiceOverloaded
+
+pytestmark = pytest.mark.unit
+
+
+class TestInstrumentedPool:
+    @pytest.fixture
+    def pool(self):
+        return InstrumentedAsyncPool(MagicMock, pool_size=1, max_overflow=0, timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_checkout_tracked(self, pool):
+        connection = await greenlet_spawn(pool.connect)
+
+        stats = pool.stats()
+        assert stats["checked_out"] == 1
+        assert stats["idle"] == 0
+        assert stats["checkouts"] == 1
+
+        await greenlet_spawn(connection.close)
+
+        stats = pool.stats()
+        assert stats["checked_out"] == 0
+        assert stats["idle"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_records_wait_and_timeout(self, pool):
+        connection = await greenlet_spawn(pool.connect)
+
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+
+        await greenlet_spawn(connection.close)
+
+        stats = pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["wait_max_ms"] >= 10
+
+
+class TestAdmissionControl:
+    @staticmethod
+    def create_pool(**admission):
+        return InstrumentedAsyncPool(MagicMock, pool_size=1, max_overflow=0, timeout=1, **admission)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_sheds_immediately(self):
+        pool = self.create_pool(queue_size=1, max_wait=0)
+        held = await greenlet_spawn(pool.connect)
+
+        queued = asyncio.create_task(greenlet_spawn(pool.connect))
+        await asyncio.sleep(0.01)
+        assert pool.waiting == 1
+
+        with pytest.raises(ServiceOverloaded):
+            await greenlet_spawn(pool.connect)
+
+        await greenlet_spawn(held.close)
+        await greenlet_spawn((await queued).close)
+
+        assert pool.stats()["shed"] == 1
+        assert pool.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_checkouts_shed_with_retry_after(self):
+        pool = self.create_pool(queue_size=0, max_wait=0.5)
+        held = await greenlet_spawn(pool.connect)
+        pool.recent_wait = 2.5
+
+        with pytest.raises(ServiceOverloaded) as raised:
+            await greenlet_spawn(pool.connect)
+
+        await greenlet_spawn(held.close)
+        assert raised.value.retry_after == 3
+
+    @pytest.mark.asyncio
+    async def test_free_connection_never_shed(self):
+        pool = self.create_pool(queue_size=1, max_wait=0.5)
+        pool.recent_wait = 10
+
+        connection = await greenlet_spawn(pool.connect)
+        await greenlet_spawn(connection.close)
+
+        assert pool.stats()["shed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shed_request_gets_problem_503(self, mock_uow, mock_board_repo):
+        mock_board_repo.get.side_effect = ServiceOverloaded(retry_after=3)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"/boards/{uuid.uuid4()}")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert response.headers["content-type"] == "application/problem+json"
+        assert response.json()["type"] == "/errors/service_overloaded"
+
+
+class TestPoolSettings:
+    def test_engine_uses_configured_pool(self):
+        assert isinstance(engine.pool, InstrumentedAsyncPool)
+        assert engine.pool.size() == 10
+        assert engine.pool._max_overflow == 20
+        assert engine.pool._pre_ping is True
+
+
+class TestPoolMetricsEndpoint:
+    @pytest.mark.asyncio
+    async def test_metrics_exposed(self, metrics_enabled):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/metrics/pool")
+
+        assert response.status_code == 200
+        data = response.json()
+        for field in ("checked_out", "idle", "overflow", "wait_avg_ms", "wait_max_ms"):
+            assert field in data["primary"]
+        assert data["replicas"] == []
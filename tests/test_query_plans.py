@@ -0,0 +1,267 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.app.storage_setup import to_async_url
+from src.board_status import BoardStatus
+from src.domain.models.base import Base
+from src.repositories.board_repo import BoardRepository
+from src.repositories.idea_repo import IdeaRepository
+from src.repositories.snapshot_repo import SnapshotRepository
+from src.repositories.user_repo import UserRepository
+from src.repositories.vote_repo import VoteRepository
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(TEST_DATABASE_URL is None, reason="TEST_DATABASE_URL is not set"),
+]
+
+SCHEMA = "query_plans"
+
+BOARDS = 5000
+IDEAS_PER_BOARD = 10
+USERS = 50000
+VOTES_PER_USER = 4
+
+DEFAULT_COST_BUDGET = 1000.0
+
+SEED = [
+    f"""
+    INSERT INTO board (id, title, status)
+    SELECT gen_random_uuid(), 'board ' || n,
+           (ARRAY['draft', 'published', 'closed'])[n % 3 + 1]::board_status
+    FROM generate_series(1, {BOARDS}) AS n
+    """,
+    f"""
+    INSERT INTO idea (id, title, description, board_id)
+    SELECT gen_random_uuid(), 'idea ' || n, 'description', board.id
+    FROM board CROSS JOIN generate_series(1, {IDEAS_PER_BOARD}) AS n
+    """,
+    f"""
+    INSERT INTO "user" (id, name, is_deleted)
+    SELECT gen_random_uuid(), 'user ' || n, false
+    FROM generate_series(1, {USERS}) AS n
+    """,
+    f"""
+    INSERT INTO vote (id, idea_id, user_id, board_id)
+    SELECT gen_random_uuid(), idea.id, voter.id, idea.board_id
+    FROM (SELECT id, row_number() OVER (ORDER BY id) AS rn FROM "user") AS voter
+    CROSS JOIN generate_series(1, {VOTES_PER_USER}) AS k
+    JOIN (SELECT id, board_id, row_number() OVER (ORDER BY id) AS rn FROM idea) AS idea
+      ON idea.rn = (voter.rn * 7919 + k * 104729) % {BOARDS * IDEAS_PER_BOARD} + 1
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    UPDATE idea SET votes_count = counted.votes
+    FROM (SELECT idea_id, count(*) AS votes FROM vote GROUP BY idea_id) AS counted
+    WHERE counted.idea_id = idea.id
+    """,
+    """
+    INSERT INTO board_snapshot (board_id, total_votes, ideas)
+    SELECT id, 0, '[]'::jsonb FROM board WHERE status = 'closed'
+    """,
+]
+
+SAMPLE = """
+    SELECT vote.id AS vote_id, vote.user_id, vote.idea_id, vote.board_id
+    FROM vote JOIN board ON board.id = vote.board_id
+    WHERE board.status = 'published'
+    LIMIT 1
+"""
+
+
+def create_engine():
+    return create_async_engine(
+        to_async_url(TEST_DATABASE_URL),
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+
+
+async def drain(batches):
+    return [batch async for batch in batches]
+
+
+# name -> (call, cost budget or None, whether a seq scan is expected)
+CASES = {
+    "board.get": (lambda r, s: r.boards.get(s.board_id), DEFAULT_COST_BUDGET, False),
+    "board.get_version": (
+        lambda r, s: r.boards.get_version(s.board_id),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "board.bump_version": (
+        lambda r, s: r.boards.bump_version(s.board_id),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "board.get_all": (lambda r, s: r.boards.get_all(50, s.board_id), DEFAULT_COST_BUDGET, False),
+    "board.stream_all": (lambda r, s: drain(r.boards.stream_all()), None, True),
+    "board.update_status": (
+        lambda r, s: r.boards.update_status(s.board_id, BoardStatus.published),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "idea.get": (lambda r, s: r.ideas.get(s.idea_id), DEFAULT_COST_BUDGET, False),
+    "idea.get_all_from_one_board": (
+        lambda r, s: r.ideas.get_all_from_one_board(s.board_id, 50, s.idea_id),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "idea.stream_from_one_board": (
+        lambda r, s: drain(r.ideas.stream_from_one_board(s.board_id)),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "idea.update_title": (
+        lambda r, s: r.ideas.update_title(s.idea_id, "title", BoardStatus.published),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "idea.reconcile_vote_counters": (
+        lambda r, s: r.ideas.reconcile_vote_counters(s.board_id),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "idea.delete": (
+        lambda r, s: r.ideas.delete(s.idea_id, BoardStatus.published),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "user.get": (lambda r, s: r.users.get(s.user_id), DEFAULT_COST_BUDGET, False),
+    "user.get_all": (lambda r, s: r.users.get_all(50, s.user_id), DEFAULT_COST_BUDGET, False),
+    "user.update_name": (
+        lambda r, s: r.users.update_name(s.user_id, "name"),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "user.delete": (lambda r, s: r.users.delete(s.user_id), DEFAULT_COST_BUDGET, False),
+    "vote.get": (lambda r, s: r.votes.get(s.vote_id), DEFAULT_COST_BUDGET, False),
+    "vote.cast": (lambda r, s: r.votes.cast(s.idea_id, s.user_id), DEFAULT_COST_BUDGET, False),
+    "vote.revoke": (lambda r, s: r.votes.revoke(s.vote_id), DEFAULT_COST_BUDGET, False),
+    "vote.get_board_results": (
+        lambda r, s: r.votes.get_board_results(s.board_id),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "vote.count_board_votes": (
+        lambda r, s: r.votes.count_board_votes(s.board_id),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "vote.stream_board_votes": (
+        lambda r, s: drain(r.votes.stream_board_votes(s.board_id)),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "vote.get_user_votes": (
+        lambda r, s: r.votes.get_user_votes(s.user_id, 50),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "vote.delete_board_votes": (
+        lambda r, s: r.votes.delete_board_votes(s.board_id),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "vote.delete_board_votes_chunk": (
+        lambda r, s: r.votes.delete_board_votes(s.board_id, 100, BoardStatus.draft),
+        DEFAULT_COST_BUDGET,
+        False,
+    ),
+    "snapshot.get": (lambda r, s: r.snapshots.get(s.board_id), DEFAULT_COST_BUDGET, False),
+}
+
+
+def seq_scans(plan: dict):
+    if plan["Node Type"] == "Seq Scan":
+        yield plan["Relation Name"]
+
+    for child in plan.get("Plans", []):
+        yield from seq_scans(child)
+
+
+@pytest.fixture(scope="module")
+def sample():
+    async def seed():
+        engine = create_engine()
+
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await connection.run_sync(Base.metadata.create_all)
+
+            for statement in SEED:
+                await connection.execute(text(statement))
+
+        async with engine.connect() as connection:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+            await connection.execute(text(f"ANALYZE {tables}"))
+            row = (await connection.execute(text(SAMPLE))).one()
+
+        await engine.dispose()
+        return SimpleNamespace(**row._mapping)
+
+    async def drop():
+        engine = create_engine()
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+    yield asyncio.run(seed())
+    asyncio.run(drop())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(CASES))
+async def test_query_plan(sample, name):
+    call, budget, seq_scan_expected = CASES[name]
+    engine = create_engine()
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    try:
+        async with AsyncSession(engine) as session:
+            repositories = SimpleNamespace(
+                boards=BoardRepository(session),
+                ideas=IdeaRepository(session),
+                users=UserRepository(session),
+                votes=VoteRepository(session),
+                snapshots=SnapshotRepository(session),
+            )
+
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            try:
+                await call(repositories, sample)
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+            connection = await session.connection()
+            for statement, parameters in statements:
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar_one()[0]["Plan"]
+
+                scanned = list(seq_scans(plan))
+                if not seq_scan_expected:
+                    assert scanned == [], f"{name} scans {scanned} sequentially: {statement}"
+
+                if budget is not None:
+                    assert plan["Total Cost"] <= budget, f"{name} costs {plan['Total Cost']}"
+
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+    assert statements, f"{name} ran no statements"
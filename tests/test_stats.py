@@ -0,0 +1,178 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.app.main import app
+from src.domain.models.snapshot import BoardSnapshot
+from src.domain.models.vote import Vote
+from src.exceptions.base import NotFoundException
+from src.services.statistic_service import StatisticService
+
+pytestmark = pytest.mark.unit
+
+
+def result_row(idea_id, votes_count, total_votes, percent_votes, rank, is_winner):
+    return SimpleNamespace(
+        idea_id=idea_id,
+        votes_count=votes_count,
+        total_votes=total_votes,
+        percent_votes=percent_votes,
+        rank=rank,
+        is_winner=is_winner,
+    )
+
+
+class TestBoardResults:
+    @pytest.fixture
+    def stat_service(self):
+        return StatisticService()
+
+    @pytest.mark.asyncio
+    async def test_results_built_from_single_query(self, stat_service, mock_uow):
+        board_id = uuid.uuid4()
+        first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        mock_uow.repositories[Vote].get_board_results.return_value = [
+            result_row(first, 2, 4, 50.0, 1, True),
+            result_row(second, 2, 4, 50.0, 1, True),
+            result_row(third, 0, 4, 0.0, 3, False),
+        ]
+
+        result = await stat_service.get_board_results(mock_uow, board_id)
+
+        assert result.board_id == board_id
+        assert result.total_votes == 4
+        assert [idea.id for idea in result.ideas if idea.is_winner] == [first, second]
+        assert result.ideas[2].votes_count == 0
+        mock_uow.repositories[Vote].get_board_results.assert_called_once_with(board_id)
+
+    @pytest.mark.asyncio
+    async def test_board_without_ideas_has_empty_results(self, stat_service, mock_uow):
+        mock_uow.repositories[Vote].get_board_results.return_value = [
+            result_row(None, None, 0, 0.0, 1, None)
+        ]
+
+        result = await stat_service.get_board_results(mock_uow, uuid.uuid4())
+
+        assert result.total_votes == 0
+        assert result.ideas == []
+
+    @pytest.mark.asyncio
+    async def test_results_for_missing_board_raise(self, stat_service, mock_uow):
+        mock_uow.repositories[Vote].get_board_results.return_value = []
+
+        with pytest.raises(NotFoundException):
+            await stat_service.get_board_results(mock_uow, uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_results_endpoint(self, mock_uow):
+        board_id = uuid.uuid4()
+        idea_id = uuid.uuid4()
+
+        mock_uow.repositories[Vote].get_board_results.return_value = [
+            result_row(idea_id, 3, 3, 100.0, 1, True)
+        ]
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"/boards/{board_id}/results")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["board_id"] == str(board_id)
+        assert data["ideas"] == [
+            {
+                "id": str(idea_id),
+                "votes_count": 3,
+                "percent_votes": 100.0,
+                "rank": 1,
+                "is_winner": True,
+            }
+        ]
+
+
+class TestFrozenResults:
+    @pytest.fixture
+    def stat_service(self):
+        return StatisticService()
+
+    @pytest.fixture
+    def snapshot(self):
+        winner, loser = uuid.uuid4(), uuid.uuid4()
+        return BoardSnapshot(
+            board_id=uuid.uuid4(),
+            total_votes=3,
+            ideas=[
+                {
+                    "id": str(winner),
+                    "votes_count": 3,
+                    "percent_votes": 100.0,
+                    "rank": 1,
+                    "is_winner": True,
+                },
+                {
+                    "id": str(loser),
+                    "votes_count": 0,
+                    "percent_votes": 0.0,
+                    "rank": 2,
+                    "is_winner": False,
+                },
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_snapshot_served_without_aggregation(self, stat_service, mock_uow, snapshot):
+        mock_uow.repositories[BoardSnapshot].get.return_value = snapshot
+
+        result = await stat_service.get_board_results(mock_uow, snapshot.board_id)
+
+        assert result.final is True
+        assert result.total_votes == 3
+        mock_uow.repositories[Vote].get_board_results.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_freeze_results_stores_snapshot(self, stat_service, mock_uow):
+        board_id, idea_id = uuid.uuid4(), uuid.uuid4()
+        mock_uow.repositories[Vote].get_board_results.return_value = [
+            result_row(idea_id, 2, 2, 100.0, 1, True)
+        ]
+
+        result = await stat_service.freeze_results(mock_uow, board_id)
+
+        assert result.final is True
+        mock_uow.repositories[BoardSnapshot].create.assert_called_once_with(
+            board_id,
+            2,
+            [
+                {
+                    "id": str(idea_id),
+                    "votes_count": 2,
+                    "percent_votes": 100.0,
+                    "rank": 1,
+                    "is_winner": True,
+                }
+            ],
+        )
+
+    @pytest.mark.parametrize("route", ["votes", "percentage", "winners", "results"])
+    async def test_closed_board_stats_are_immutable(self, mock_uow, snapshot, route):
+        mock_uow.repositories[BoardSnapshot].get.return_value = snapshot
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"/boards/{snapshot.board_id}/{route}")
+
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+
+    async def test_live_board_stats_not_cached(self, mock_uow):
+        mock_uow.repositories[Vote].get_board_results.return_value = [
+            result_row(uuid.uuid4(), 1, 1, 100.0, 1, True)
+        ]
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"/boards/{uuid.uuid4()}/winners")
+
+        assert response.status_code == 200
+        assert response.json()["winners_count"] == 1
+        assert "cache-control" not in response.headers
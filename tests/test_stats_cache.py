@@ -0,0 +1,248 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.adapters.db_work_unit import DBWorkUnit
+from src.adapters.stats_cache import NullStatsCache, StatsCache
+from src.app.main import app
+from src.board_status import BoardStatus
+from src.config import settings
+from src.domain.models.board import Board
+from src.domain.models.vote import Vote
+from src.domain.schemas.board import BoardStatusUpdate
+from src.domain.schemas.vote import VoteCreate
+from src.services.board_service import BoardMaintainService
+from src.services.statistic_service import StatisticService
+from src.services.vote_service import VoteMaintainService
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStatsCache:
+    def test_miss_then_hit(self):
+        cache = StatsCache(max_size=2, ttl=10)
+        board_id = uuid.uuid4()
+
+        assert cache.get(board_id) is None
+        cache.set(board_id, "results")
+
+        assert cache.get(board_id) == "results"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = StatsCache(max_size=2, ttl=5, clock=clock)
+        board_id = uuid.uuid4()
+
+        cache.set(board_id, "results")
+        clock.now = 5.0
+
+        assert cache.get(board_id) is None
+        assert cache.stats()["size"] == 0
+
+    def test_least_recently_used_entry_evicted(self):
+        cache = StatsCache(max_size=2, ttl=10)
+        first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        cache.set(first, 1)
+        cache.set(second, 2)
+        cache.get(first)
+        cache.set(third, 3)
+
+        assert cache.get(second) is None
+        assert cache.get(first) == 1
+        assert cache.evictions == 1
+
+    def test_stale_read_not_stored_after_invalidation(self):
+        cache = StatsCache(max_size=2, ttl=10)
+        board_id = uuid.uuid4()
+
+        generation = cache.generation(board_id)
+        cache.invalidate(board_id)
+        cache.set(board_id, "stale", generation)
+
+        assert cache.get(board_id) is None
+
+    def test_other_boards_invalidation_keeps_read(self):
+        cache = StatsCache(max_size=2, ttl=10)
+        board_id, other = uuid.uuid4(), uuid.uuid4()
+
+        generation = cache.generation(board_id)
+        cache.invalidate(other)
+        cache.set(board_id, "fresh", generation)
+
+        assert cache.get(board_id) == "fresh"
+
+    def test_stale_read_refused_after_generation_evicted(self):
+        cache = StatsCache(max_size=2, ttl=10)
+        board_id = uuid.uuid4()
+
+        generation = cache.generation(board_id)
+        cache.invalidate(board_id)
+        cache.invalidate(uuid.uuid4())
+        cache.invalidate(uuid.uuid4())
+        cache.set(board_id, "stale", generation)
+
+        assert cache.get(board_id) is None
+
+    def test_null_cache_never_stores(self):
+        cache = NullStatsCache()
+        board_id = uuid.uuid4()
+
+        cache.set(board_id, "results")
+
+        assert cache.get(board_id) is None
+        assert cache.stats()["enabled"] is False
+
+
+class TestCommitHooks:
+    async def test_hooks_run_after_commit(self, session):
+        uow = DBWorkUnit(lambda: session)
+        hook = MagicMock()
+
+        async with uow:
+            uow.session.add(object())
+            uow.on_commit(hook)
+            hook.assert_not_called()
+
+        session.commit.assert_awaited_once()
+        hook.assert_called_once_with()
+
+    async def test_hooks_dropped_on_rollback(self, session):
+        uow = DBWorkUnit(lambda: session)
+        hook = MagicMock()
+
+        with pytest.raises(RuntimeError):
+            async with uow:
+                uow.on_commit(hook)
+                raise RuntimeError
+
+        hook.assert_not_called()
+
+
+class TestCachedStatistics:
+    @pytest.fixture
+    def cache(self):
+        return StatsCache(max_size=16, ttl=60)
+
+    @pytest.fixture
+    def board_id(self):
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def results_rows(self):
+        return [
+            SimpleNamespace(
+                idea_id=uuid.uuid4(),
+                votes_count=1,
+                total_votes=1,
+                percent_votes=100.0,
+                rank=1,
+                is_winner=True,
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_served_from_cache(self, cache, mock_uow, board_id, results_rows):
+        mock_uow.repositories[Vote].get_board_results.return_value = results_rows
+        stat_service = StatisticService(cache)
+
+        first = await stat_service.get_board_results(mock_uow, board_id)
+        second = await stat_service.get_board_results(mock_uow, board_id)
+
+        assert first is second
+        mock_uow.repositories[Vote].get_board_results.assert_called_once_with(board_id)
+
+    @pytest.mark.asyncio
+    async def test_pinned_client_bypasses_cache(self, cache, mock_uow, board_id, results_rows):
+        mock_uow.repositories[Vote].get_board_results.return_value = results_rows
+        mock_uow.pinned_to_primary = True
+        cache.set(board_id, "stale")
+
+        results = await StatisticService(cache).get_board_results(mock_uow, board_id)
+
+        assert results.total_votes == 1
+        mock_uow.repositories[Vote].get_board_results.assert_called_once_with(board_id)
+
+    @pytest.mark.asyncio
+    async def test_vote_invalidates_board_on_commit(self, cache, mock_uow, board_id):
+        cache.set(board_id, "results")
+        mock_uow.repositories[Vote].cast.return_value = SimpleNamespace(
+            user_exists=True,
+            board_id=board_id,
+            board_status=BoardStatus.published,
+            vote_id=uuid.uuid4(),
+        )
+
+        await VoteMaintainService(cache).create_vote(
+            mock_uow, VoteCreate(idea_id=uuid.uuid4(), user_id=uuid.uuid4())
+        )
+
+        assert cache.get(board_id) == "results"
+
+        (hook,), _ = mock_uow.on_commit.call_args
+        hook()
+
+        assert cache.get(board_id) is None
+
+    @pytest.mark.asyncio
+    async def test_status_change_invalidates_board(self, cache, mock_uow, board_id):
+        board = Board(id=board_id, title="Board", status=BoardStatus.draft)
+        cache.set(board_id, "results")
+        mock_uow.repositories[Board].get.return_value = board
+        mock_uow.repositories[Board].update_status.return_value = board
+
+        await BoardMaintainService(cache=cache).change_board_status(
+            mock_uow, board_id, BoardStatusUpdate(status=BoardStatus.published)
+        )
+
+        (hook,), _ = mock_uow.on_commit.call_args
+        hook()
+
+        assert cache.get(board_id) is None
+
+
+class TestStatsCacheMetrics:
+    async def test_metrics_exposed(self, mock_uow, metrics_enabled):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/metrics/stats_cache")
+
+        assert response.status_code == 200
+        data = response.json()
+        for field in ("hits", "misses", "evictions", "size", "max_size"):
+            assert field in data
+
+
+class TestMetricsAccess:
+    async def test_disabled_by_default(self, mock_uow):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/metrics/stats_cache")
+
+        assert response.status_code == 404
+
+    async def test_token_required_when_set(self, mock_uow, metrics_enabled, monkeypatch):
+        monkeypatch.setattr(settings, "metrics_token", "secret")
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            missing = await client.get("/metrics/stats_cache")
+            wrong = await client.get(
+                "/metrics/stats_cache", headers={"Authorization": "Bearer guess"}
+            )
+            valid = await client.get(
+                "/metrics/stats_cache", headers={"Authorization": "Bearer secret"}
+            )
+
+        assert missing.status_code == 401
+        assert wrong.status_code == 401
+        assert valid.status_code == 200
@@ -0,0 +1,389 @@
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Response
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.exc import DBAPIError
+
+from src.adapters import deadline
+from src.adapters.db_work_unit import QUERY_CANCELED, DBWorkUnit
+from src.adapters.deadline import apply_statement_timeout
+from src.app import di_frame
+from src.app.di_frame import PRIMARY_STICKY_COOKIE, create_uow, get_uow
+from src.app.main import app
+from src.board_status import BoardStatus
+from src.domain.models.board import Board
+from src.domain.models.idea import Idea
+from src.domain.schemas.idea import IdeaUpdateTitle
+from src.exceptions.base import DeadlineExceeded
+from src.exceptions.board import InvalidBoardStatus
+from src.services.idea_service import IdeaMaintainService
+
+pytestmark = pytest.mark.unit
+
+
+class TestReentrantWorkUnit:
+    @pytest.fixture
+    def session_factory(self, session):
+        return MagicMock(return_value=session)
+
+    @pytest.fixture
+    def uow(self, session_factory, mock_board_repo, mock_idea_repo):
+        return DBWorkUnit.create_with_repositories(
+            session_factory,
+            {
+                Board: lambda session: mock_board_repo,
+                Idea: lambda session: mock_idea_repo,
+            },
+        )
+
+    @pytest.fixture
+    def sample_board(self):
+        return Board(id=uuid.uuid4(), title="Test Board", status=BoardStatus.draft)
+
+    @pytest.fixture
+    def sample_idea(self, sample_board):
+        return Idea(
+            id=uuid.uuid4(),
+            title="Test Idea",
+            description="Test Description",
+            board_id=sample_board.id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_nested_blocks_share_one_session(self, uow, session_factory, session):
+        async with uow:
+            outer = uow.session
+
+            async with uow:
+                assert uow.session is outer
+
+            session.commit.assert_not_awaited()
+            session.close.assert_not_awaited()
+
+        session_factory.assert_called_once_with()
+        session.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nested_service_calls_open_one_session(
+        self,
+        uow,
+        session_factory,
+        session,
+        mock_board_repo,
+        mock_idea_repo,
+        sample_board,
+        sample_idea,
+    ):
+        mock_idea_repo.get.return_value = sample_idea
+        mock_board_repo.get.return_value = sample_board
+        mock_idea_repo.update_title.return_value = sample_idea
+
+        async with uow:
+            await IdeaMaintainService().change_title(
+                uow, sample_idea.id, IdeaUpdateTitle(title="New Title")
+            )
+
+        session_factory.assert_called_once_with()
+        session.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_inner_error_rolls_back_whole_unit(
+        self, uow, session, mock_board_repo, mock_idea_repo, sample_board, sample_idea
+    ):
+        sample_board.status = BoardStatus.closed
+        mock_idea_repo.update_title.return_value = None
+        mock_idea_repo.get.return_value = sample_idea
+        mock_board_repo.get.return_value = sample_board
+
+        async with uow:
+            with pytest.raises(InvalidBoardStatus):
+                await IdeaMaintainService().change_title(
+                    uow, sample_idea.id, IdeaUpdateTitle(title="New Title")
+                )
+
+        session.commit.assert_not_awaited()
+        session.rollback.assert_awaited_once()
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reentering_after_exit_opens_new_session(self, uow, session_factory, session):
+        async with uow:
+            uow.repositories[Board]
+
+        async with uow:
+            uow.repositories[Board]
+
+        assert session_factory.call_count == 2
+        assert session.close.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_session_closed_when_commit_fails(self, uow, session):
+        session.commit.side_effect = RuntimeError
+
+        with pytest.raises(RuntimeError):
+            async with uow:
+                uow.repositories[Board]
+
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_one_session_per_request(
+        self,
+        uow,
+        session_factory,
+        session,
+        mock_board_repo,
+        mock_idea_repo,
+        sample_board,
+        sample_idea,
+    ):
+        mock_idea_repo.get.return_value = sample_idea
+        mock_board_repo.get.return_value = sample_board
+        mock_idea_repo.update_title.return_value = sample_idea
+
+        async def __get_uow():
+            async with uow:
+                yield uow
+
+        app.dependency_overrides[get_uow] = __get_uow
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.patch(
+                f"/ideas/{sample_idea.id}/new_title", json={"title": "New Title"}
+            )
+
+        assert response.status_code == 200
+        session_factory.assert_called_once_with()
+        session.commit.assert_awaited_once()
+        session.close.assert_awaited_once()
+
+
+class TestLazyWorkUnit:
+    @pytest.fixture
+    def session_factory(self, session):
+        return MagicMock(return_value=session)
+
+    @pytest.fixture
+    def repo_factory(self, mock_idea_repo):
+        return MagicMock(return_value=mock_idea_repo)
+
+    @pytest.fixture
+    def uow(self, session_factory, repo_factory):
+        return DBWorkUnit.create_with_repositories(session_factory, {Idea: repo_factory})
+
+    @pytest.mark.asyncio
+    async def test_untouched_unit_opens_no_session(self, uow, session_factory, repo_factory):
+        async with uow:
+            pass
+
+        session_factory.assert_not_called()
+        repo_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_repository_built_once_on_first_access(
+        self, uow, session_factory, repo_factory, session
+    ):
+        async with uow:
+            first = uow.repositories[Idea]
+            second = uow.repositories[Idea]
+
+        assert first is second
+        repo_factory.assert_called_once_with(session)
+        session_factory.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_repositories_rebuilt_for_next_session(self, uow, repo_factory):
+        async with uow:
+            uow.repositories[Idea]
+
+        async with uow:
+            uow.repositories[Idea]
+
+        assert repo_factory.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_only_unit_skips_commit(self, session_factory, repo_factory, session):
+        uow = DBWorkUnit.create_with_repositories(
+            session_factory, {Idea: repo_factory}, read_only=True
+        )
+        hook = MagicMock()
+
+        async with uow:
+            uow.repositories[Idea]
+            uow.on_commit(hook)
+
+        session.commit.assert_not_awaited()
+        session.rollback.assert_not_awaited()
+        session.close.assert_awaited_once()
+        hook.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method, read_only", [("GET", True), ("HEAD", True), ("POST", False)])
+    async def test_get_uow_read_only_by_method(self, method, read_only):
+        dependency = get_uow(SimpleNamespace(method=method, cookies={}), Response())
+        uow = await dependency.__anext__()
+
+        assert uow.read_only is read_only
+        await dependency.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rejected_request_opens_no_session(self, session_factory):
+        uow = create_uow()
+        uow.session_factory = session_factory
+
+        async def __get_uow():
+            async with uow:
+                yield uow
+
+        app.dependency_overrides[get_uow] = __get_uow
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/ideas/not-a-uuid")
+
+        assert response.status_code == 422
+        session_factory.assert_not_called()
+
+
+class TestReplicaRouting:
+    @pytest.fixture
+    def replica(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def primary(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def with_replicas(self, monkeypatch, replica):
+        monkeypatch.setattr(di_frame, "replica_session_factories", [replica])
+        monkeypatch.setattr(di_frame, "next_replica_session_factory", lambda: replica)
+
+    @staticmethod
+    async def resolve(method: str, cookies: dict):
+        response = Response()
+        dependency = get_uow(SimpleNamespace(method=method, cookies=cookies), response)
+        uow = await dependency.__anext__()
+        await dependency.aclose()
+        return uow, response
+
+    def test_read_only_unit_reads_from_replica(self, primary, replica):
+        uow = DBWorkUnit(primary, read_only=True, replica_session_factory=replica)
+
+        assert uow.session is replica.return_value
+        primary.assert_not_called()
+
+    def test_writing_unit_uses_primary(self, primary, replica):
+        uow = DBWorkUnit(primary, replica_session_factory=replica)
+
+        assert uow.session is primary.return_value
+        replica.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_routed_to_replica(self, with_replicas, replica):
+        uow, response = await self.resolve("GET", {})
+
+        assert uow.replica_session_factory is replica
+        assert PRIMARY_STICKY_COOKIE not in response.headers.get("set-cookie", "")
+
+    @pytest.mark.asyncio
+    async def test_write_pins_client_to_primary(self, with_replicas):
+        uow, response = await self.resolve("POST", {})
+
+        assert uow.replica_session_factory is None
+        assert PRIMARY_STICKY_COOKIE in response.headers["set-cookie"]
+
+    @pytest.mark.asyncio
+    async def test_pinned_client_reads_own_writes_from_primary(self, with_replicas):
+        _, response = await self.resolve("POST", {})
+        cookie = response.headers["set-cookie"].split(";")[0].split("=", 1)[1]
+
+        uow, _ = await self.resolve("GET", {PRIMARY_STICKY_COOKIE: cookie})
+
+        assert uow.replica_session_factory is None
+        assert uow.pinned_to_primary is True
+
+    @pytest.mark.asyncio
+    async def test_forged_pin_reads_from_replica(self, with_replicas, replica):
+        cookies = {PRIMARY_STICKY_COOKIE: str(time.time() + 10**9)}
+        uow, _ = await self.resolve("GET", cookies)
+
+        assert uow.replica_session_factory is replica
+        assert uow.pinned_to_primary is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("value", ["0", "garbage"])
+    async def test_expired_or_invalid_pin_reads_from_replica(self, with_replicas, replica, value):
+        uow, _ = await self.resolve("GET", {PRIMARY_STICKY_COOKIE: value})
+
+        assert uow.replica_session_factory is replica
+
+    @pytest.mark.asyncio
+    async def test_no_pin_without_replicas(self):
+        uow, response = await self.resolve("POST", {})
+
+        assert uow.replica_session_factory is None
+        assert "set-cookie" not in response.headers
+
+    def test_replicas_require_a_shared_secret(self, with_replicas, monkeypatch):
+        monkeypatch.setattr(di_frame.settings, "replica_stickiness_secret", "")
+
+        with pytest.raises(RuntimeError):
+            di_frame._sticky_secret()
+
+        monkeypatch.setattr(di_frame.settings, "replica_stickiness_secret", "shared")
+        assert di_frame._sticky_secret() == b"shared"
+
+
+class TestDeadlines:
+    @pytest.fixture
+    def uow(self, session):
+        return DBWorkUnit(MagicMock(return_value=session))
+
+    @pytest.mark.asyncio
+    async def test_cancelled_unit_discards_connection(self, uow, session):
+        with pytest.raises(asyncio.CancelledError):
+            async with uow:
+                uow.session.add(object())
+                raise asyncio.CancelledError()
+
+        session.invalidate.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_statement_timeout_becomes_504(self, uow, session):
+        canceled = DBAPIError("SELECT", {}, SimpleNamespace(sqlstate=QUERY_CANCELED))
+        deadline.start(5)
+
+        with pytest.raises(DeadlineExceeded):
+            async with uow:
+                uow.session.add(object())
+                raise canceled
+
+        session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_statement_timeout_set_from_remaining_budget(self):
+        connection = MagicMock()
+        deadline.start(5)
+
+        apply_statement_timeout(None, None, connection)
+
+        (statement,) = connection.exec_driver_sql.call_args.args
+        assert statement.startswith("SET LOCAL statement_timeout = ")
+        assert 4000 < int(statement.rsplit(" ", 1)[1]) <= 5000
+
+    @pytest.mark.asyncio
+    async def test_no_statement_timeout_outside_requests(self):
+        connection = MagicMock()
+
+        apply_statement_timeout(None, None, connection)
+
+        connection.exec_driver_sql.assert_not_called()
@@ -46,7 +46,7 @@ class TestUserService:
     @pytest.mark.asyncio
     async def test_deleting_nonexistent_user_raises_error(self, user_service, mock_uow):
         user_id = uuid.uuid4()
-        mock_uow.repositories[User].get.return_value = None
+        mock_uow.repositories[User].delete.return_value = False
 
         with pytest.raises(NotFoundException):
             await user_service.delete_user(mock_uow, user_id)
@@ -62,6 +62,8 @@ class TestUserService:
         mock_uow.repositories[User].get.return_value = sample_user
         mock_uow.repositories[Vote].get_user_votes.return_value = mock_votes
 
-        result = await user_service.get_votes_history(mock_uow, user_id)
+        result = await user_service.get_votes_history(mock_uow, user_id, limit=10)
 
-        assert len(result) == 2
+        assert len(result.items) == 2
+        assert result.next_cursor is None
+        mock_uow.repositories[Vote].get_user_votes.assert_called_once_with(user_id, 11, None)
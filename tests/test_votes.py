@@ -1,4 +1,5 @@
 import uuid
+from types import SimpleNamespace
 
 import pytest
 
@@ -8,6 +9,7 @@ from src.domain.models.idea import Idea
 from src.domain.models.user import User
 from src.domain.models.vote import Vote
 from src.domain.schemas.vote import VoteCreate
+from src.exceptions.base import NotFoundException
 from src.exceptions.board import InvalidBoardStatus
 from src.exceptions.vote import AlreadyVoted
 from src.services.vote_service import VoteMaintainService
@@ -34,31 +36,43 @@ class TestVoteService:
             id=uuid.uuid4(), title="Test Idea", description="Test", board_id=sample_board.id
         )
 
+    @pytest.fixture
+    def cast_outcome(self, sample_board):
+        def _outcome(**overrides):
+            fields = {
+                "user_exists": True,
+                "board_id": sample_board.id,
+                "board_status": sample_board.status,
+                "vote_id": uuid.uuid4(),
+            }
+            fields.update(overrides)
+            return SimpleNamespace(**fields)
+
+        return _outcome
+
     @pytest.mark.asyncio
     async def test_vote_created_for_published_board(
-        self, vote_service, mock_uow, sample_user, sample_idea, sample_board
+        self, vote_service, mock_uow, sample_user, sample_idea, sample_board, cast_outcome
     ):
-        vote = Vote(id=uuid.uuid4(), idea_id=sample_idea.id, user_id=sample_user.id)
-
-        mock_uow.repositories[User].get.return_value = sample_user
-        mock_uow.repositories[Idea].get.return_value = sample_idea
-        mock_uow.repositories[Board].get.return_value = sample_board
-        mock_uow.repositories[Vote].is_voted_already.return_value = False
-        mock_uow.repositories[Vote].create.return_value = vote
+        outcome = cast_outcome()
+        mock_uow.repositories[Vote].cast.return_value = outcome
 
         data = VoteCreate(idea_id=sample_idea.id, user_id=sample_user.id)
         result = await vote_service.create_vote(mock_uow, data)
 
+        assert result.id == outcome.vote_id
         assert result.idea_id == sample_idea.id
+        assert result.board_id == sample_board.id
+        mock_uow.repositories[Vote].cast.assert_called_once_with(sample_idea.id, sample_user.id)
+        mock_uow.repositories[User].get.assert_not_called()
+        mock_uow.repositories[Idea].get.assert_not_called()
+        mock_uow.repositories[Board].get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_cannot_vote_twice_on_same_board(
-        self, vote_service, mock_uow, sample_user, sample_idea, sample_board
+        self, vote_service, mock_uow, sample_user, sample_idea, cast_outcome
     ):
-        mock_uow.repositories[User].get.return_value = sample_user
-        mock_uow.repositories[Idea].get.return_value = sample_idea
-        mock_uow.repositories[Board].get.return_value = sample_board
-        mock_uow.repositories[Vote].is_voted_already.return_value = True
+        mock_uow.repositories[Vote].cast.return_value = cast_outcome(vote_id=None)
 
         data = VoteCreate(idea_id=sample_idea.id, user_id=sample_user.id)
 
@@ -67,16 +81,85 @@ class TestVoteService:
 
     @pytest.mark.asyncio
     async def test_cannot_vote_on_draft_board(
-        self, vote_service, mock_uow, sample_user, sample_idea, sample_board
+        self, vote_service, mock_uow, sample_user, sample_idea, cast_outcome
     ):
-        sample_board.status = BoardStatus.draft
-
-        mock_uow.repositories[User].get.return_value = sample_user
-        mock_uow.repositories[Idea].get.return_value = sample_idea
-        mock_uow.repositories[Board].get.return_value = sample_board
-        mock_uow.repositories[Vote].is_voted_already.return_value = False
+        mock_uow.repositories[Vote].cast.return_value = cast_outcome(
+            board_status=BoardStatus.draft, vote_id=None
+        )
 
         data = VoteCreate(idea_id=sample_idea.id, user_id=sample_user.id)
 
         with pytest.raises(InvalidBoardStatus):
             await vote_service.create_vote(mock_uow, data)
+
+    @pytest.mark.asyncio
+    async def test_cannot_vote_as_missing_user(
+        self, vote_service, mock_uow, sample_idea, cast_outcome
+    ):
+        mock_uow.repositories[Vote].cast.return_value = cast_outcome(
+            user_exists=False, vote_id=None
+        )
+
+        data = VoteCreate(idea_id=sample_idea.id, user_id=uuid.uuid4())
+
+        with pytest.raises(NotFoundException) as exc_info:
+            await vote_service.create_vote(mock_uow, data)
+
+        assert exc_info.value.object_type is User
+
+    @pytest.mark.asyncio
+    async def test_cannot_vote_for_missing_idea(
+        self, vote_service, mock_uow, sample_user, cast_outcome
+    ):
+        mock_uow.repositories[Vote].cast.return_value = cast_outcome(
+            board_id=None, board_status=None, vote_id=None
+        )
+
+        data = VoteCreate(idea_id=uuid.uuid4(), user_id=sample_user.id)
+
+        with pytest.raises(NotFoundException) as exc_info:
+            await vote_service.create_vote(mock_uow, data)
+
+        assert exc_info.value.object_type is Idea
+
+    @pytest.fixture
+    def revoke_outcome(self, sample_board):
+        def _outcome(**overrides):
+            fields = {
+                "board_id": sample_board.id,
+                "board_status": sample_board.status,
+                "removed": 1,
+            }
+            fields.update(overrides)
+            return SimpleNamespace(**fields)
+
+        return _outcome
+
+    @pytest.mark.asyncio
+    async def test_vote_revoked_in_one_statement(self, vote_service, mock_uow, revoke_outcome):
+        vote_id = uuid.uuid4()
+        mock_uow.repositories[Vote].revoke.return_value = revoke_outcome()
+
+        await vote_service.delete_vote(mock_uow, vote_id)
+
+        mock_uow.repositories[Vote].revoke.assert_called_once_with(vote_id)
+        mock_uow.repositories[Vote].get.assert_not_called()
+        mock_uow.repositories[Board].get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_revoking_missing_vote_raises_not_found(
+        self, vote_service, mock_uow, revoke_outcome
+    ):
+        outcome = revoke_outcome(board_id=None, board_status=None, removed=0)
+        mock_uow.repositories[Vote].revoke.return_value = outcome
+
+        with pytest.raises(NotFoundException):
+            await vote_service.delete_vote(mock_uow, uuid.uuid4())
+
+    @pytest.mark.asyncio
+    async def test_revoking_on_closed_board_rejected(self, vote_service, mock_uow, revoke_outcome):
+        outcome = revoke_outcome(board_status=BoardStatus.closed, removed=0)
+        mock_uow.repositories[Vote].revoke.return_value = outcome
+
+        with pytest.raises(InvalidBoardStatus):
+            await vote_service.delete_vote(mock_uow, uuid.uuid4())